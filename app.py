@@ -762,12 +762,12 @@ def analyze():
             dashboard_html = dashboard_builder.build_ticket_dashboard(analytics, label, args)
             save_dashboard_file(output_dir, "ticket_analytics_dashboard.html", dashboard_html)
             save_summary_file(output_dir, "ticket_analytics_summary.txt", summary_text)
-            save_csv_file(output_dir, "tickets_transformed.csv", analytics['processed_df'])
+            save_csv_file(output_dir, "tickets_transformed.csv", analytics['processed_df'], parquet_date_col="Create date")
         elif dashboard_type == 'chat':
             dashboard_html = dashboard_builder.build_chat_dashboard(analytics, label, args)
             save_dashboard_file(output_dir, "chat_analytics_dashboard.html", dashboard_html)
             save_summary_file(output_dir, "chat_analytics_summary.txt", summary_text)
-            save_csv_file(output_dir, "chats_transformed.csv", analytics['processed_df'])
+            save_csv_file(output_dir, "chats_transformed.csv", analytics['processed_df'], parquet_date_col="chat_creation_date_adt")
         elif dashboard_type == 'combined':
             # Generate both ticket and chat dashboards
             ticket_dashboard_html = None
@@ -780,7 +780,7 @@ def analyze():
                 })()
                 ticket_dashboard_html = dashboard_builder.build_ticket_dashboard(analytics['ticket_analytics'], label, args)
                 save_dashboard_file(output_dir, "ticket_analytics_dashboard.html", ticket_dashboard_html)
-                save_csv_file(output_dir, "tickets_transformed.csv", analytics['ticket_analytics']['processed_df'])
+                save_csv_file(output_dir, "tickets_transformed.csv", analytics['ticket_analytics']['processed_df'], parquet_date_col="Create date")
             
             if analytics['chat_analytics']:
                 args = type('MockArgs', (), {
@@ -789,7 +789,7 @@ def analyze():
                 })()
                 chat_dashboard_html = dashboard_builder.build_chat_dashboard(analytics['chat_analytics'], label, args)
                 save_dashboard_file(output_dir, "chat_analytics_dashboard.html", chat_dashboard_html)
-                save_csv_file(output_dir, "chats_transformed.csv", analytics['chat_analytics']['processed_df'])
+                save_csv_file(output_dir, "chats_transformed.csv", analytics['chat_analytics']['processed_df'], parquet_date_col="chat_creation_date_adt")
             
             # Save combined summary
             save_summary_file(output_dir, "combined_analytics_summary.txt", summary_text)
@@ -1238,7 +1238,7 @@ def handle_individual_agent_analysis(data_source, selected_files, individual_per
         save_dashboard_file(output_dir, 'individual_agent_dashboard.html', dashboard_html)
         
         # Save processed data as CSV for consistency with other dashboards
-        save_csv_file(output_dir, 'tickets_transformed.csv', analyzer.processed_data)
+        save_csv_file(output_dir, 'tickets_transformed.csv', analyzer.processed_data, parquet_date_col='Create date')
         
         # Generate summary text
         insights = analysis['summary']
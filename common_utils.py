@@ -353,11 +353,41 @@ def save_dashboard_file(output_dir: Path, filename: str, html_content: str) -> N
         f.write(html_content)
     print(f"✅ {filename}")
 
-def save_csv_file(output_dir: Path, filename: str, dataframe: pd.DataFrame) -> None:
-    """Save processed CSV file"""
+# Hidden column of processed Parquet files holding the date column as UTC timestamps, so
+# widget range filters can be pushed down to Arrow (see widgets/registry.py)
+PARQUET_DATE_COL = "__date_utc"
+
+def save_csv_file(output_dir: Path, filename: str, dataframe: pd.DataFrame,
+                  parquet_date_col: Optional[str] = None) -> None:
+    """Save processed CSV file, plus a Parquet sibling for widgets when parquet_date_col is given"""
     csv_path = output_dir / filename
     dataframe.to_csv(csv_path, index=False)
     print(f"✅ {filename}")
+    if parquet_date_col is not None:
+        save_parquet_sibling(csv_path, parquet_date_col)
+
+def save_parquet_sibling(csv_path: Path, date_col: Optional[str] = None) -> None:
+    """
+    Write <name>.parquet next to a processed CSV (skipped when pyarrow is not installed).
+
+    Built from the CSV as pandas reads it back, so widgets get the same columns and dtypes
+    from either file, plus date_col parsed to UTC in PARQUET_DATE_COL.
+    """
+    parquet_path = csv_path.with_suffix(".parquet")
+    # Write to a temporary name first so concurrent widget loads never see a partial file
+    tmp_path = csv_path.with_name(f"{csv_path.stem}.{os.getpid()}.parquet.tmp")
+    try:
+        df = pd.read_csv(csv_path)
+        if date_col in df.columns:
+            df[PARQUET_DATE_COL] = pd.to_datetime(df[date_col], utc=True, errors="coerce", format="ISO8601")
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd", index=False)
+        os.replace(tmp_path, parquet_path)
+        print(f"✅ {parquet_path.name}")
+    except ImportError:
+        pass  # No pyarrow: widgets read the CSV
+    except Exception as e:
+        print(f"⚠️ Could not save {parquet_path.name}: {e}")
+        tmp_path.unlink(missing_ok=True)
 
 # --------------------------------------------------
 # Logging and Output
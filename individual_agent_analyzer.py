@@ -129,7 +129,7 @@ class IndividualAgentAnalyzer:
         response_times = team_data['First Response Time (Hours)'].dropna()
         
         # Calculate per-agent stats first
-        agent_stats = team_data.groupby('Case Owner').agg({
+        agent_stats = team_data.groupby('Case Owner', observed=True).agg({
             'First Response Time (Hours)': ['count', 'mean', 'median', 'std']
         }).round(3)
         
@@ -0,0 +1,9 @@
+"""Shared pytest setup: make the top-level modules importable from the repository root"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
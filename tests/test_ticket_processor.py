@@ -0,0 +1,228 @@
+"""Equivalence checks for the vectorized TicketDataProcessor helpers against the code they replaced"""
+
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+import ticket_processor
+from ticket_processor import TicketDataProcessor
+
+SCHEDULE_FILE = str(Path(__file__).resolve().parent.parent / "config" / "schedule.yaml")
+EDT = pytz.timezone("US/Eastern")
+
+
+@pytest.fixture
+def processor():
+    return TicketDataProcessor(schedule_file=SCHEDULE_FILE)
+
+
+def _random_create_dates(n=5000, seed=0):
+    """UTC timestamps over two years (both DST transitions, all weekdays) with some NaT"""
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp("2024-01-01", tz="UTC")
+    dates = pd.Series(start + pd.to_timedelta(rng.integers(0, 2 * 365 * 24 * 60, n), unit="min"))
+    dates[rng.random(n) < 0.02] = pd.NaT
+    return dates
+
+
+def _as_list(values):
+    """Plain list with None for every missing value, so NaN/None/categorical compare equal"""
+    values = pd.Series(values).astype(object)
+    return values.where(values.notna(), None).tolist()
+
+
+def _row_wise_weekend(create_date):
+    """Previous per-row check: Friday 6PM - Monday 5AM EDT, missing dates are not weekend"""
+    if pd.isna(create_date):
+        return False
+    dt_edt = create_date.astimezone(EDT)
+    weekday = dt_edt.weekday()
+    current_time = dt_edt.time()
+    if weekday == 4 and current_time >= datetime.strptime("18:00", "%H:%M").time():
+        return True
+    if weekday in [5, 6]:
+        return True
+    if weekday == 0 and current_time < datetime.strptime("05:00", "%H:%M").time():
+        return True
+    return False
+
+
+# --------------------------------------------------
+# Weekend flag
+# --------------------------------------------------
+
+def test_is_weekend_period_matches_row_wise_check():
+    dates = _random_create_dates().dropna()
+    edt = dates.dt.tz_convert("US/Eastern")
+    weekday = edt.dt.weekday.to_numpy()
+    minutes = (edt.dt.hour * 60 + edt.dt.minute).to_numpy()
+
+    result = TicketDataProcessor._is_weekend_period(weekday, minutes)
+
+    assert result.tolist() == [_row_wise_weekend(d) for d in dates]
+
+
+def test_add_weekend_flag_numpy_path_matches_row_wise_check(processor, monkeypatch):
+    monkeypatch.setattr(ticket_processor, "NUMBA_AVAILABLE", False)
+    dates = _random_create_dates()
+    df = pd.DataFrame({"Create date": dates})
+
+    result = processor._add_weekend_flag(df)
+
+    assert result["Weekend_Ticket"].tolist() == [_row_wise_weekend(d) for d in dates]
+
+
+def test_weekend_mask_kernel_matches_numpy_path():
+    pytest.importorskip("numba")
+    dates = _random_create_dates()
+    edt = dates.dt.tz_convert("US/Eastern")
+    weekday = edt.dt.weekday.fillna(-1).to_numpy(dtype=np.int8)
+    minutes = (edt.dt.hour * 60 + edt.dt.minute).fillna(-1).to_numpy(dtype=np.int16)
+
+    out = np.zeros(len(weekday), dtype=np.bool_)
+    ticket_processor._weekend_mask_kernel(weekday, minutes, out)
+
+    expected = (weekday >= 0) & TicketDataProcessor._is_weekend_period(weekday, minutes)
+    assert out.tolist() == expected.tolist()
+    assert out.tolist() == [_row_wise_weekend(d) for d in dates]
+
+
+# --------------------------------------------------
+# Row filters
+# --------------------------------------------------
+
+def test_apply_row_filters_matches_two_step_filter(processor, capsys):
+    rng = np.random.default_rng(1)
+    n = 2000
+    df = pd.DataFrame({
+        "Pipeline": pd.Categorical(rng.choice(["Support Pipeline", "SPAM Tickets", "Live Chat "], n)),
+        "Case Owner": pd.Categorical(rng.choice(["Girly", "Nova", "Richie", "Francis", "Bhushan", "Spencer"], n)),
+        "Value": rng.random(n),
+    })
+
+    # Previous behaviour: drop SPAM first, then keep support-team owners only
+    expected = df[df["Pipeline"] != "SPAM Tickets"].copy()
+    expected = expected[expected["Case Owner"].isin(["Bhushan", "Girly", "Nova", "Francis"])].copy()
+
+    result = processor._apply_row_filters(df)
+
+    pd.testing.assert_frame_equal(
+        result.astype({"Pipeline": object, "Case Owner": object}),
+        expected.astype({"Pipeline": object, "Case Owner": object}),
+    )
+    out = capsys.readouterr().out
+    assert f"Removed {int((df['Pipeline'] == 'SPAM Tickets').sum()):,} SPAM tickets." in out
+
+
+# --------------------------------------------------
+# Name mapping
+# --------------------------------------------------
+
+def test_map_categories_matches_series_map():
+    mapping = {"Girly E": "Girly", "Gillie": "Girly", "Nora": "Nova", "0": "Support Pipeline"}
+    values = pd.Series(["Girly E", "Gillie", "Girly", "Nora", "Shan", None, "0", "Girly E", np.nan])
+
+    expected = values.map(mapping).fillna(values)
+    result = pd.Series(TicketDataProcessor._map_categories(values, mapping))
+
+    assert _as_list(result) == _as_list(expected)
+    # Several names map to one label: the categories are merged, not duplicated
+    assert list(result.cat.categories).count("Girly") == 1
+
+
+def test_map_categories_accepts_categorical_input():
+    mapping = {"a": "x", "b": "x"}
+    values = pd.Series(["a", "b", "c", None], dtype="category")
+
+    result = TicketDataProcessor._map_categories(values, mapping)
+
+    assert _as_list(result) == ["x", "x", "c", None]
+    assert list(result.categories) == ["x", "c"]
+
+
+# --------------------------------------------------
+# Trend lines
+# --------------------------------------------------
+
+@pytest.mark.parametrize("n", [2, 3, 31, 400])
+def test_linear_trend_matches_polyfit(n):
+    volumes = np.random.default_rng(n).integers(0, 80, n)
+    x = np.arange(n)
+
+    slope, intercept = np.polyfit(x, volumes, 1)
+
+    np.testing.assert_allclose(TicketDataProcessor._linear_trend(volumes), slope * x + intercept,
+                               rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("n", [2, 3, 10, 250])
+def test_linear_fit_matches_polyfit(n):
+    rng = np.random.default_rng(n)
+    x = np.sort(rng.choice(np.arange(n * 3), n, replace=False)).astype(float)
+    y = rng.random(n) * 50
+
+    slope, intercept = TicketDataProcessor._linear_fit(x, y)
+    expected_slope, expected_intercept = np.polyfit(x, y, 1)
+
+    assert slope == pytest.approx(expected_slope, rel=1e-9, abs=1e-12)
+    assert intercept == pytest.approx(expected_intercept, rel=1e-9, abs=1e-12)
+
+
+# --------------------------------------------------
+# CSV reader
+# --------------------------------------------------
+
+# Every default pandas NA token, each in its own row, next to values that must survive as text
+_NA_TOKENS = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+              '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+
+@pytest.fixture
+def ticket_csv(tmp_path):
+    """Ticket export with a UTF-8 BOM, quoted multi-line values and every NA token"""
+    rows = [["Ticket ID", "Create date", "Case Owner", "Pipeline", "Notes"]]
+    rows += [[str(i), "2025-01-0%d 10:00" % (i % 9 + 1), token, "0", "n/a or none"]
+             for i, token in enumerate(_NA_TOKENS)]
+    rows += [["100", "", "Girly", token, "multi\nline, quoted"] for token in ["1", " ", "NULLS"]]
+    text = "\n".join(",".join('"%s"' % v if ("\n" in v or "," in v) else v for v in row) for row in rows)
+    path = tmp_path / "tickets.csv"
+    path.write_text("﻿" + text + "\n", encoding="utf-8")
+    return path
+
+
+def _read_both(processor, monkeypatch, path, usecols=None):
+    pytest.importorskip("pyarrow")
+    arrow = processor._read_csv_file(path, usecols=usecols)
+    monkeypatch.setattr(ticket_processor, "PYARROW_AVAILABLE", False)
+    return arrow, processor._read_csv_file(path, usecols=usecols)
+
+
+def test_ticket_na_values_include_pandas_defaults():
+    assert set(ticket_processor._ARROW_NULL_VALUES) == set(_NA_TOKENS) | set(ticket_processor.TICKET_NA_VALUES)
+
+
+@pytest.mark.filterwarnings("error::FutureWarning")  # None vs NaN mismatches warn in pandas 2.x
+@pytest.mark.parametrize("usecols", [None, ["Pipeline", "Missing column", "Ticket ID", "Case Owner"]])
+def test_read_csv_file_pyarrow_matches_pandas(processor, monkeypatch, ticket_csv, usecols):
+    arrow, expected = _read_both(processor, monkeypatch, ticket_csv, usecols)
+
+    pd.testing.assert_frame_equal(arrow, expected)
+    assert "Ticket ID" in arrow.columns  # BOM stripped from the header
+    # Missing values are NaN in both readers, not None
+    assert arrow.isna().equals(expected.isna())
+    assert all(isinstance(v, float) for v in arrow.to_numpy()[arrow.isna().to_numpy()])
+
+
+def test_read_csv_file_falls_back_to_pandas_on_arrow_error(processor, monkeypatch, tmp_path, capsys):
+    # A short row is an error for Arrow but is padded with NaN by pandas
+    path = tmp_path / "ragged.csv"
+    path.write_text("Ticket ID,Create date,Case Owner\n1,2025-01-01,Girly\n2,2025-01-02\n")
+
+    result, expected = _read_both(processor, monkeypatch, path)
+
+    assert "retrying with pandas" in capsys.readouterr().out
+    pd.testing.assert_frame_equal(result, expected)
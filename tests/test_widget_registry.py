@@ -0,0 +1,46 @@
+"""Equivalence checks for widget registry helpers against the pandas code they replaced"""
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Loaded from its file so the tests do not need Flask (widgets/__init__ registers the blueprint)
+_spec = importlib.util.spec_from_file_location(
+    "widget_registry", Path(__file__).resolve().parent.parent / "widgets" / "registry.py")
+registry = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(registry)
+
+
+def _random_dates(n=20000, seed=0):
+    """Naive timestamps from 1940 to 2040 (pre-epoch days included) with some NaT"""
+    rng = np.random.default_rng(seed)
+    seconds = rng.integers(-30 * 365 * 86400, 70 * 365 * 86400, n)
+    dates = pd.Series(pd.to_datetime(seconds, unit="s"), name="Create date")
+    dates[rng.random(n) < 0.05] = pd.NaT
+    return dates
+
+
+@pytest.mark.parametrize("tz", [None, "UTC", "America/New_York", "Asia/Kolkata"])
+def test_week_start_matches_to_period(tz):
+    dates = _random_dates()
+    if tz is not None:
+        dates = dates.dt.tz_localize("UTC").dt.tz_convert(tz)
+    dates.index = dates.index * 2  # index and name must be carried over
+
+    expected = (dates.dt.tz_localize(None) if tz else dates).dt.to_period("W-MON").dt.start_time
+    result = registry._week_start(dates)
+
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_week_start_is_tuesday():
+    # "W-MON" weeks end on Monday, so they start on Tuesday
+    dates = pd.Series(pd.date_range("2025-03-01", periods=21, freq="D", tz="US/Eastern"))
+
+    result = registry._week_start(dates)
+
+    assert (result.dt.weekday == 1).all()
+    assert result.iloc[0] == pd.Timestamp("2025-02-25")
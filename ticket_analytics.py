@@ -132,7 +132,7 @@ class TicketAnalytics:
         save_summary_file(output_dir, "ticket_analytics_summary.txt", ticket_summary)
         
         # Save processed ticket CSV
-        save_csv_file(output_dir, "tickets_transformed.csv", ticket_analytics['processed_df'])
+        save_csv_file(output_dir, "tickets_transformed.csv", ticket_analytics['processed_df'], parquet_date_col="Create date")
         
         # Create simple index file
         index_html = f"""
@@ -4,53 +4,510 @@ Ticket Data Processor for Unified Analytics
 Handles ticket CSV files and generates ticket-specific analytics
 """
 
+import csv
+import json
+import logging
+import os
+import warnings
 import pandas as pd
 import numpy as np
 import pytz
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 import yaml
 from pathlib import Path
+from string import Template
 from typing import Dict, List, Optional, Tuple
+import matplotlib
+matplotlib.use("Agg")  # charts are only rasterised to PNG for HTML embedding; skip GUI backend setup
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# PyArrow's multithreaded CSV reader is used when installed
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    from plotly.offline import get_plotlyjs_version
+    PLOTLY_AVAILABLE = True
+except ImportError:
+    PLOTLY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from common_utils import (
     fig_to_html, create_metric_card, create_time_series_chart,
     create_bar_chart, is_interactive_mode, chart_to_html,
     render_chart_with_fallback
 )
 
+logger = logging.getLogger(__name__)
+
+# Timestamp columns converted to US/Eastern during processing
+TICKET_DATE_COLUMNS = [
+    "Create date", "Close date", "First agent email response date",
+    "Last activity date", "Last Closed Date", "Last contacted date",
+    "Last customer reply date", "Owner assigned date",
+    "Last message received date", "Last response date"
+]
+
+# Strings treated as missing values when reading ticket CSVs
+TICKET_NA_VALUES = ['', 'NULL', 'null', 'None']
+
+# pandas' default NA tokens (applied on top of na_values) plus the ticket ones, so the PyArrow
+# reader turns exactly the same strings into missing values as the pandas fallback
+_PANDAS_DEFAULT_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+_ARROW_NULL_VALUES = sorted(set(_PANDAS_DEFAULT_NA_VALUES) | set(TICKET_NA_VALUES))
+
+# Columns read by the analytics pipeline (pass to load_data(usecols=...) to skip the rest)
+TICKET_ANALYTICS_COLUMNS = TICKET_DATE_COLUMNS + [
+    "Ticket ID", "Ticket number", "ID", "Pipeline",
+    "Ticket owner", "Case Owner", "Last Modified Date"
+]
+
+# Dark theme shared by the Plotly charts (height, titles and axes stay per chart)
+_DARK_LAYOUT = dict(
+    template='plotly_dark',
+    plot_bgcolor='rgba(30, 30, 46, 0.8)',
+    paper_bgcolor='rgba(23, 23, 35, 0.9)',
+    font=dict(color='#e0e0e0'),
+)
+
+# Per-agent colours for the interactive volume bar and pie charts
+_AGENT_PALETTE = ['rgba(78, 205, 196, 0.8)', 'rgba(255, 107, 107, 0.8)',
+                  'rgba(255, 234, 167, 0.8)', 'rgba(162, 155, 254, 0.8)']
+
+# Row markup for the agent performance table (filled via str.format)
+_AGENT_ROW_TEMPLATE = """
+            <tr>
+                <td style="font-weight:bold">{agent}</td>
+                <td style="text-align:center">{tickets}</td>
+                <td style="text-align:center">{percentage}%</td>
+                <td style="text-align:center">{daily_average}</td>
+                <td style="text-align:center">{avg_time}</td>
+                <td style="text-align:center">{median_time}</td>
+                <td style="font-size:0.85em; max-width:200px; overflow:hidden; text-overflow:ellipsis;">{pipeline_text}</td>
+            </tr>
+            """
+
+# Row markup for the delayed response table (filled via str.format)
+_DELAYED_ROW_TEMPLATE = """
+            <tr>
+                <td style="font-weight:bold">{ticket_id}</td>
+                <td style="text-align:center;color:#d9534f;font-weight:bold">{response_time:.2f}h</td>
+                <td style="text-align:center">{agent}</td>
+                <td style="text-align:center">{create_date}</td>
+                <td style="text-align:center">{pipeline}</td>
+            </tr>
+            """
+
+# Static markup around the agent performance table rows
+_AGENT_TABLE_HEADER = """
+        <div class="section">
+            <h2>Agent Performance & Volume Breakdown (Weekdays Only)</h2>
+            <div style="margin-bottom: 10px; color: #e0e0e0; font-size: 0.9em;">
+                📊 Volume analysis across {date_range_days} day(s) • {n_agents} active agents • Response times exclude LiveChat tickets
+            </div>
+            <div class="table-container">
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>Agent</th>
+                            <th>Total<br>Tickets</th>
+                            <th>% of<br>Total</th>
+                            <th>Daily<br>Avg</th>
+                            <th>Avg Response<br>Time (excl. LiveChat)</th>
+                            <th>Median Response<br>Time (excl. LiveChat)</th>
+                            <th>Top Pipeline</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+"""
+
+_AGENT_TABLE_FOOTER = """
+                    </tbody>
+                </table>
+            </div>
+            <div style="margin-top: 10px; color: #999; font-size: 0.8em; font-style: italic;">
+                💡 Tip: Higher volume agents may show different response time patterns due to workload distribution.
+            </div>
+        </div>
+        """
+
+# Weekly fallback variants with more weeks than this only label the most recent bar
+_WEEKLY_BAR_LABEL_LIMIT = 52
+
+# Shared styles for the weekly chart toggle and bar-type controls (emitted once per dashboard)
+_WEEKLY_CHART_CSS = """
+            <style>
+            .week-toggle-controls {
+                display: flex;
+                gap: 8px;
+                align-items: center;
+            }
+            .week-toggle-btn {
+                background: linear-gradient(135deg, #667eea, #764ba2);
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                border-radius: 6px;
+                font-size: 0.85em;
+                cursor: pointer;
+                transition: all 0.2s ease;
+                opacity: 0.7;
+                font-weight: 500;
+                box-shadow: 0 2px 4px rgba(0,0,0,0.2);
+            }
+            .week-toggle-btn:hover {
+                opacity: 1;
+                transform: translateY(-1px);
+                box-shadow: 0 4px 8px rgba(0,0,0,0.3);
+            }
+            .week-toggle-btn.active {
+                opacity: 1;
+                background: linear-gradient(135deg, #00d4aa, #36d1dc);
+                box-shadow: 0 3px 6px rgba(0,212,170,0.4);
+                font-weight: bold;
+                transform: translateY(-1px);
+            }
+            .weekly-chart-container {
+                margin: 15px 0;
+                background: rgba(23, 23, 35, 0.6);
+                border-radius: 10px;
+                padding: 15px;
+                border: 1px solid rgba(102, 126, 234, 0.2);
+                box-shadow: 0 4px 8px rgba(0,0,0,0.3);
+            }
+            .weekly-variant {
+                display: none;
+            }
+            .weekly-variant.active {
+                display: block;
+            }
+            .bar-type-controls {
+                background: rgba(45, 52, 54, 0.8);
+                padding: 15px;
+                border-radius: 10px;
+                border: 1px solid rgba(255,255,255,0.15);
+                min-width: 300px;
+                box-shadow: 0 2px 6px rgba(0,0,0,0.2);
+            }
+            .bar-controls-grid {
+                display: grid;
+                grid-template-columns: 1fr 1fr;
+                gap: 10px;
+                font-size: 0.85em;
+            }
+            .bar-control {
+                display: flex;
+                align-items: center;
+                gap: 8px;
+                color: #e0e0e0;
+                cursor: pointer;
+                padding: 6px 8px;
+                border-radius: 6px;
+                transition: all 0.2s ease;
+                font-weight: 500;
+            }
+            .bar-control:hover {
+                background-color: rgba(255,255,255,0.15);
+                transform: translateX(2px);
+            }
+            .bar-toggle {
+                accent-color: #00d4aa;
+                width: 16px;
+                height: 16px;
+                cursor: pointer;
+            }
+            </style>
+            """
+
+# Toggle/range script for one interactive weekly chart ($stat_type-scoped names; see _create_interactive_weekly_chart)
+_WEEKLY_CHART_SCRIPT = Template("""
+            <script>
+            // Full per-trace x/y, captured from the rendered figure before the first slice
+            let WEEKLY_FULL_${stat_type} = null;
+
+            function showWeeklyChart_${stat_type}(weeks) {
+                // Slice every trace to the selected number of trailing weeks in one restyle
+                const plotlyDiv = document.getElementById('plotly-div-${stat_type}-all');
+                if (plotlyDiv && window.Plotly && plotlyDiv.data) {
+                    if (!WEEKLY_FULL_${stat_type}) {
+                        WEEKLY_FULL_${stat_type} = plotlyDiv.data.map(trace => ({
+                            x: Array.from(trace.x || []),
+                            y: Array.from(trace.y || [])
+                        }));
+                    }
+                    const start = weeks === 'all' ? 0 : -Number(weeks);
+                    window.Plotly.restyle(plotlyDiv, {
+                        x: WEEKLY_FULL_${stat_type}.map(trace => trace.x.slice(start)),
+                        y: WEEKLY_FULL_${stat_type}.map(trace => trace.y.slice(start))
+                    });
+                }
+                
+                // Update button states
+                document.querySelectorAll('.week-toggle-btn-${stat_type}').forEach(btn => {
+                    btn.classList.remove('active');
+                });
+                const activeBtn = document.querySelector('.week-toggle-btn-${stat_type}[data-weeks="' + weeks + '"]');
+                if (activeBtn) {
+                    activeBtn.classList.add('active');
+                }
+                
+                // Weekend controls disabled - no bar visibility changes needed
+            }
+
+            // Toggle type of each trace in figure order (customdata tag; null for untagged traces)
+            const WEEKLY_TRACE_TYPES_${stat_type} = ${trace_types};
+
+            // Explicit defaults: weekend series off by default; others on
+            const WEEKLY_DEFAULTS_${stat_type} = { all: true, weekday: true, 'trend-all': true, 'trend-weekday': true, weekend: false, 'trend-weekend': false };
+
+            // Bar toggle checkboxes for this stat type, looked up once in initControls
+            let TOGGLES_${stat_type} = [];
+
+            function initControls_${stat_type}() {
+                TOGGLES_${stat_type} = document.querySelectorAll('.bar-toggle-${stat_type}');
+                // Force initial checkbox states to defaults (prevents any accidental auto-checking)
+                const defaults = WEEKLY_DEFAULTS_${stat_type};
+                TOGGLES_${stat_type}.forEach(cb => {
+                    const t = cb.dataset.barType;
+                    if (Object.prototype.hasOwnProperty.call(defaults, t)) {
+                        cb.checked = defaults[t];
+                    }
+                });
+            }
+            
+            function applyBarVisibility_${stat_type}() {
+                const defaults = WEEKLY_DEFAULTS_${stat_type};
+                // Start from defaults, then override with live checkbox states
+                const visibilityMap = Object.assign({}, defaults);
+
+                // Build visibility map from checkboxes
+                TOGGLES_${stat_type}.forEach(checkbox => {
+                    const barType = checkbox.dataset.barType;
+                    visibilityMap[barType] = checkbox.checked;
+                });
+                
+                // Restyle the single weekly plot; trace types are fixed when the figure is built
+                const plotlyDiv = document.getElementById('plotly-div-${stat_type}-all');
+                if (plotlyDiv && window.Plotly && plotlyDiv.data) {
+                    const visible = WEEKLY_TRACE_TYPES_${stat_type}.map(traceType =>
+                        traceType !== null && Object.prototype.hasOwnProperty.call(visibilityMap, traceType) ? visibilityMap[traceType] : true
+                    );
+                    window.Plotly.restyle(plotlyDiv, { visible: visible });
+                }
+            }
+            
+            // Coalesce toggle changes into at most one restyle per animation frame for this stat type
+            let pendingRAF_${stat_type} = 0;
+            function updateChartDisplay_${stat_type}() {
+                if (pendingRAF_${stat_type}) return;
+                pendingRAF_${stat_type} = requestAnimationFrame(() => {
+                    pendingRAF_${stat_type} = 0;
+                    applyBarVisibility_${stat_type}();
+                });
+            }
+            
+            // Add event listeners for bar toggles for this stat type
+            document.addEventListener('DOMContentLoaded', function() {
+                // Ensure default-off logic for weekend before first render pass
+                initControls_${stat_type}();
+
+                // Apply checkbox visibility once Plotly has drawn; the range restyle below always triggers a redraw
+                const plotlyDiv = document.getElementById('plotly-div-${stat_type}-all');
+                if (plotlyDiv && plotlyDiv.once) {
+                    plotlyDiv.once('plotly_afterplot', updateChartDisplay_${stat_type});
+                }
+                showWeeklyChart_${stat_type}('${default_weeks}');
+
+                // One delegated listener for all bar toggles of this stat type
+                const section = document.getElementById('${section_id}');
+                if (section) {
+                    section.addEventListener('change', event => {
+                        if (event.target.classList.contains('bar-toggle-${stat_type}')) {
+                            updateChartDisplay_${stat_type}();
+                        }
+                    });
+                }
+            });
+            </script>
+            """)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _weekend_mask_kernel(weekday, minutes, out):
+        """Single-pass Friday 6PM - Monday 5AM EDT check; negative weekdays (missing dates) stay False"""
+        for i in range(weekday.shape[0]):
+            w = weekday[i]
+            m = minutes[i]
+            out[i] = (w == 4 and m >= 18 * 60) or w >= 5 or (w == 0 and 0 <= m < 5 * 60)
+
+@lru_cache(maxsize=32)
+def _agent_figure_specs(agents: Tuple, tickets: Tuple[int, ...], percentages: Tuple[float, ...], bar_text: Tuple[str, ...],
+                        avg_times: Tuple[Optional[float], ...], median_times: Tuple[Optional[float], ...]) -> Tuple[Tuple[str, int], ...]:
+    """Build the interactive agent volume and response time figures as (JSON spec, height) pairs.
+
+    Memoised on the (hashable) values: Plotly spends most of a render validating traces,
+    deep-copying the plotly_dark template and serialising, so repeat renders of the same stats
+    reuse the finished JSON strings. Missing response times are passed as None and serialise
+    to null (gaps instead of 0 bars).
+    """
+    # Chart 1: Volume Distribution Bar Chart & Pie Chart
+    fig1 = make_subplots(
+        rows=1, cols=2,
+        column_widths=[0.6, 0.4],
+        subplot_titles=('📊 Ticket Volume by Agent', '🍰 Volume Distribution'),
+        specs=[[{"type": "bar"}, {"type": "pie"}]]
+    )
+
+    # Bar chart
+    fig1.add_trace(
+        go.Bar(
+            x=list(agents),
+            y=list(tickets),
+            name="Tickets Handled",
+            marker_color=_AGENT_PALETTE[:len(agents)],
+            text=list(bar_text),
+            textposition='auto',
+            hovertemplate='<b>%{x}</b><br>Tickets: %{y}<br>Percentage: %{customdata}%<extra></extra>',
+            customdata=list(percentages)
+        ),
+        row=1, col=1
+    )
+
+    # Pie chart
+    fig1.add_trace(
+        go.Pie(
+            labels=list(agents),
+            values=list(tickets),
+            name="Distribution",
+            marker_colors=_AGENT_PALETTE[:len(agents)],
+            textinfo='label+percent',
+            textposition='auto'
+        ),
+        row=1, col=2
+    )
+
+    fig1.update_layout(
+        title_text="📊 Agent Performance: Volume Analysis",
+        **_DARK_LAYOUT,
+        height=400,
+        showlegend=False
+    )
+
+    fig1.update_xaxes(title_text="Agent", row=1, col=1)
+    fig1.update_yaxes(title_text="Number of Tickets", row=1, col=1)
+
+    # Chart 2: Response Time Comparison (Average vs Median)
+    x_agents = list(agents)
+
+    # Traces and layout go through one Figure constructor (validated and themed once)
+    # rather than an empty figure patched by add_trace/update_layout calls
+    fig2 = go.Figure(
+        data=[
+            go.Bar(
+                x=x_agents,
+                y=list(avg_times),
+                name='Average Response Time',
+                marker_color='rgba(102, 126, 234, 0.8)',
+                offsetgroup=1
+            ),
+            go.Bar(
+                x=x_agents,
+                y=list(median_times),
+                name='Median Response Time',
+                marker_color='rgba(255, 107, 107, 0.8)',
+                offsetgroup=2
+            ),
+        ],
+        layout=dict(
+            title='⏱️ Response Time Comparison: Average vs Median',
+            xaxis_title='Agent',
+            yaxis_title='Response Time (Hours)',
+            **_DARK_LAYOUT,
+            height=400,
+            barmode='group',
+            xaxis=dict(gridcolor='rgba(102, 126, 234, 0.2)', showgrid=True),
+            yaxis=dict(gridcolor='rgba(102, 126, 234, 0.2)', showgrid=True),
+            annotations=[
+                dict(
+                    text="💡 <b>Average vs Median:</b> When median is much lower than average, the agent has consistent fast responses but occasional long delays",
+                    xref="paper", yref="paper",
+                    x=0.5, y=1.15, xanchor='center', yanchor='bottom',
+                    showarrow=False,
+                    font=dict(size=11, color='#00d4aa'),
+                    bgcolor='rgba(0, 212, 170, 0.1)',
+                    bordercolor='rgba(0, 212, 170, 0.3)',
+                    borderwidth=1
+                )
+            ]
+        )
+    )
+    
+    return (fig1.to_json(), fig1.layout.height), (fig2.to_json(), fig2.layout.height)
+
+
 class TicketDataProcessor:
     """Processes support ticket data and generates analytics"""
     
     def __init__(self, schedule_file: str = 'config/schedule.yaml'):
         self.df = None
-        self.original_df = None
+        self.original_row_count = 0
         self.processed_files = []
         self.schedule_file = schedule_file
+        self._plotlyjs_included = False
+        self._weekly_css_included = False
+        self._week_start_cache = None
+        self._non_livechat_cache = None
+        self._weekly_stats_cache = None
         
-    def load_data(self, ticket_files: List[Path]) -> pd.DataFrame:
-        """Load and validate ticket CSV files"""
+    def load_data(self, ticket_files: List[Path], usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        """Load and validate ticket CSV files
+
+        By default every column is kept so the transformed CSV export stays complete;
+        pass ``usecols`` (e.g. ``TICKET_ANALYTICS_COLUMNS``) to only parse those columns.
+        """
         if not ticket_files:
             raise FileNotFoundError("No ticket CSV files found")
 
-        all_data = []
-        for file_path in ticket_files:
+        def _read_one(file_path: Path) -> Optional[pd.DataFrame]:
             # Skip only specific problematic files, not all archive files
             if file_path.name.endswith('.processed') and file_path.stat().st_size < 1000:
                 print(f"⚠️  Skipping small processed file: {file_path.name}")
-                continue
+                return None
             try:
-                # Improved CSV loading for complex files with mixed data types
-                df = pd.read_csv(file_path, 
-                               low_memory=False,  # Handle mixed types properly
-                               dtype=str,         # Read all as strings initially
-                               na_values=['', 'NULL', 'null', 'None'])
-                all_data.append(df)
-                self.processed_files.append(file_path)
+                df = self._read_csv_file(file_path, usecols)
                 print(f"✅ Loaded {len(df):,} records from {file_path.name} ({len(df.columns)} columns)")
+                return df
             except Exception as e:
                 print(f"⚠️  Could not load {file_path.name}: {e}")
+                return None
+
+        # CSV parsing releases the GIL, so files are read concurrently; map() keeps input order
+        max_workers = min(len(ticket_files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(_read_one, ticket_files))
+
+        all_data = []
+        for file_path, df in zip(ticket_files, frames):
+            if df is not None:
+                all_data.append(df)
+                self.processed_files.append(file_path)
 
         if not all_data:
             error_msg = f"No valid ticket data could be loaded from {len(ticket_files)} files. "
@@ -59,11 +516,45 @@ class TicketDataProcessor:
             raise ValueError(error_msg)
 
         self.df = pd.concat(all_data, ignore_index=True)
-        self.original_df = self.df.copy()
+        # Only the pre-filter record count is reported later, so no snapshot of the frame is kept
+        self.original_row_count = len(self.df)
         
         print(f"✅ Total ticket records loaded: {len(self.df):,}")
         return self.df
     
+    def _read_csv_file(self, file_path: Path, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read one ticket CSV with every column as strings, preferring the PyArrow reader"""
+        wanted = set(usecols) if usecols is not None else None
+
+        if PYARROW_AVAILABLE:
+            try:
+                # Only the header line is needed to type every column as a string
+                with open(file_path, newline='', encoding='utf-8-sig') as f:
+                    header = next(csv.reader(f), [])
+                columns = [col for col in header if wanted is None or col in wanted]
+                table = pa_csv.read_csv(
+                    file_path,
+                    parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={col: pa.string() for col in columns},
+                        include_columns=columns,
+                        null_values=_ARROW_NULL_VALUES,
+                        strings_can_be_null=True,
+                    ),
+                )
+                # Arrow yields None for missing strings; pandas' reader yields NaN
+                return table.to_pandas().fillna(np.nan)
+            except (ValueError, pa.ArrowException) as e:
+                print(f"⚠️  PyArrow could not parse {file_path.name} ({e}), retrying with pandas")
+
+        # Improved CSV loading for complex files with mixed data types
+        return pd.read_csv(file_path,
+                           low_memory=False,  # Handle mixed types properly
+                           dtype=str,         # Read all as strings initially
+                           na_values=TICKET_NA_VALUES,
+                           # Callable form tolerates exports that lack some of the requested columns
+                           usecols=(lambda col: col in wanted) if wanted is not None else None)
+    
     def process_data(self) -> pd.DataFrame:
         """Apply all ticket data transformations"""
         if self.df is None:
@@ -74,8 +565,7 @@ class TicketDataProcessor:
         self.df = self._map_pipeline_names(self.df)
         self.df = self._add_weekend_flag(self.df)
         self.df = self._calc_first_response(self.df)
-        self.df = self._remove_spam(self.df)
-        self.df = self._remove_manager_tickets(self.df)
+        self.df = self._apply_row_filters(self.df)
         self.df = self._add_canonical_utc_columns(self.df)
 
         return self.df
@@ -102,27 +592,19 @@ class TicketDataProcessor:
         start_utc = _to_utc(start_dt)
         end_utc = _to_utc(end_dt)
 
-        mask = (series >= start_utc) & (series <= end_utc)
+        # Inclusive on both ends, evaluated as a single range check
+        mask = series.between(start_utc, end_utc)
         filtered = self.df[mask].copy()
         return filtered, len(self.df), len(filtered)
     
     def _convert_timezone(self, df: pd.DataFrame) -> pd.DataFrame:
         """Convert CDT timestamps to EDT"""
-        central = pytz.timezone("US/Central")
-        eastern = pytz.timezone("US/Eastern")
-        
-        date_cols = [
-            "Create date", "Close date", "First agent email response date",
-            "Last activity date", "Last Closed Date", "Last contacted date",
-            "Last customer reply date", "Owner assigned date",
-            "Last message received date", "Last response date"
-        ]
-        
-        for col in date_cols:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors="coerce", utc=True)
-                if pd.api.types.is_datetime64_any_dtype(df[col]):
-                    df[col] = df[col].dt.tz_convert(eastern)
+        present = [col for col in TICKET_DATE_COLUMNS if col in df.columns]
+        if present:
+            # Parse per column (formats differ between exports) but write the block back once
+            df[present] = df[present].apply(
+                lambda col: pd.to_datetime(col, errors="coerce", utc=True).dt.tz_convert("US/Eastern")
+            )
         
         print("Converted CDT → EDT (+1h)")
         return df
@@ -171,13 +653,34 @@ class TicketDataProcessor:
             owner_col = "Case Owner"
 
         if owner_col:
-            df["Case Owner"] = df[owner_col].map(mapping).fillna(df[owner_col])
+            # Low-cardinality: categorical codes make compares/groupbys cheap, and the
+            # name mapping only has to touch the handful of distinct owner names
+            df["Case Owner"] = self._map_categories(df[owner_col], mapping)
             print("Mapped staff names.")
         else:
             print("Warning: No owner column found to map staff names")
 
         return df
 
+    @staticmethod
+    def _map_categories(values: pd.Series, mapping: Dict[str, str]) -> pd.Categorical:
+        """Apply a value mapping to a low-cardinality column via its categories.
+
+        Only the distinct values are looked up (numeric IDs are compared as strings);
+        unmapped values are kept. Several values may map to the same label, so the
+        categories are merged by remapping codes rather than renamed.
+        """
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype("category")
+        categories = values.cat.categories
+        if categories.dtype != object:
+            categories = categories.astype(str)
+        mapped = categories.map(lambda value: mapping.get(value, value))
+        labels = mapped.unique()
+        # The appended -1 is picked up by code -1 and keeps missing values missing
+        new_codes = np.append(labels.get_indexer(mapped), -1)[values.cat.codes]
+        return pd.Categorical.from_codes(new_codes, categories=labels)
+
     def _map_pipeline_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """Map pipeline IDs to readable labels"""
         # Pipeline mapping from HubSpot
@@ -196,8 +699,8 @@ class TicketDataProcessor:
         }
 
         if "Pipeline" in df.columns:
-            # Convert to string first (in case they're numeric)
-            df["Pipeline"] = df["Pipeline"].astype(str).map(pipeline_mapping).fillna(df["Pipeline"])
+            # Mapped on the distinct IDs only; unmapped values keep their ID
+            df["Pipeline"] = self._map_categories(df["Pipeline"], pipeline_mapping)
             print("Mapped pipeline IDs to readable names.")
         else:
             print("Warning: No Pipeline column found")
@@ -217,107 +720,23 @@ class TicketDataProcessor:
                 "Please check the file exists and has valid YAML format"
             ) from e
 
-        edt_tz = pytz.timezone('US/Eastern')
-        
-        def _is_agent_off_shift(row):
-            """Check if ticket was created during agent's off-shift hours with buffer logic"""
-            if pd.isna(row["Create date"]):
-                return False
-                
-            # Convert to EDT timezone
-            dt_edt = row["Create date"].astimezone(edt_tz)
-            weekday = dt_edt.weekday()  # Monday=0, Sunday=6
-            day_name = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'][weekday]
-            
-            # Check weekend definition first: Friday after 6PM EDT until Monday at 5AM EDT
-            if _is_weekend_period(dt_edt):
-                return True
-            
-            # Get agent from ticket
-            agent_name = row.get("Case Owner", row.get("Ticket owner", "")).strip()
-            
-            # Use agent-specific schedule if available, otherwise fallback to global shifts
-            if agent_name in agents_config:
-                agent_schedule = agents_config[agent_name]
-            else:
-                # Fallback to global shifts for backward compatibility
-                agent_schedule = shifts_config
-                if agent_name:  # Only print warning if agent name exists
-                    print(f"⚠️  No agent-specific schedule found for '{agent_name}', using global shifts")
-            
-            # Check if day has any shifts defined
-            if day_name not in agent_schedule:
-                return True  # No shifts defined = off-shift
-                
-            day_schedule = agent_schedule[day_name]
-            
-            # Handle full coverage days
-            if day_schedule == 'full':
-                return False
-                
-            # Handle empty schedule (no shifts)
-            if not day_schedule:
-                return True
-                
-            # Check if during any scheduled shift (with 30-minute buffer)
-            current_time = dt_edt.time()
-            on_shift = False
-            
-            for shift in day_schedule:
-                try:
-                    start_time = datetime.strptime(shift['start'], '%H:%M').time()
-                    end_time = datetime.strptime(shift['end'], '%H:%M').time()
-                    
-                    # Apply 30-minute buffer: include tickets 30min before shift starts
-                    start_with_buffer = (datetime.combine(dt_edt.date(), start_time) - timedelta(minutes=30)).time()
-                    
-                    # Handle overnight shifts (end < start)
-                    if end_time < start_time:
-                        # Overnight shift logic with buffer
-                        if current_time >= start_with_buffer or current_time < end_time:
-                            on_shift = True
-                            break
-                    else:
-                        # Normal shift logic with buffer
-                        if start_with_buffer <= current_time < end_time:
-                            on_shift = True
-                            break
-                            
-                except (KeyError, TypeError, ValueError) as e:
-                    print(f"⚠️  Invalid shift format for {agent_name} on {day_name}: {shift}")
-                    continue
-                    
-            return not on_shift
-        
-        def _is_weekend_period(dt_edt):
-            """Check if timestamp falls within weekend period: Friday 6PM EDT - Monday 5AM EDT"""
-            weekday = dt_edt.weekday()  # Monday=0, Sunday=6
-            current_time = dt_edt.time()
-            
-            # Friday after 6PM
-            if weekday == 4 and current_time >= datetime.strptime('18:00', '%H:%M').time():
-                return True
-                
-            # Saturday and Sunday (all day)
-            if weekday in [5, 6]:
-                return True
-                
-            # Monday before 5AM
-            if weekday == 0 and current_time < datetime.strptime('05:00', '%H:%M').time():
-                return True
-                
-            return False
-
         # Apply the weekend flag logic (calendar-based only, not agent-specific)
-        def _is_calendar_weekend(row):
-            """Check if ticket was created during actual weekend period (Friday 6PM EDT - Monday 5AM EDT)"""
-            if pd.isna(row["Create date"]):
-                return False
-            # Convert to EDT timezone
-            dt_edt = row["Create date"].astimezone(edt_tz)
-            return _is_weekend_period(dt_edt)
-        
-        df["Weekend_Ticket"] = df.apply(_is_calendar_weekend, axis=1)
+        create_dates = df["Create date"]
+        if not pd.api.types.is_datetime64_any_dtype(create_dates):
+            create_dates = pd.to_datetime(create_dates, errors="coerce", utc=True)
+        if create_dates.dt.tz is None:
+            create_dates = create_dates.dt.tz_localize("US/Central", ambiguous="NaT", nonexistent="NaT")
+        if str(create_dates.dt.tz) != "US/Eastern":
+            create_dates = create_dates.dt.tz_convert("US/Eastern")
+
+        weekday = create_dates.dt.weekday.fillna(-1).to_numpy(dtype=np.int8)
+        minutes = (create_dates.dt.hour * 60 + create_dates.dt.minute).fillna(-1).to_numpy(dtype=np.int16)
+        if NUMBA_AVAILABLE:
+            weekend = np.zeros(len(weekday), dtype=np.bool_)
+            _weekend_mask_kernel(weekday, minutes, weekend)
+        else:
+            weekend = (weekday >= 0) & self._is_weekend_period(weekday, minutes)
+        df["Weekend_Ticket"] = weekend
         
         # Statistics
         weekend_count = df['Weekend_Ticket'].sum()
@@ -329,7 +748,17 @@ class TicketDataProcessor:
         
         return df
 
-    
+    @staticmethod
+    def _is_weekend_period(weekday, minutes):
+        """Check if weekday/minute-of-day values fall within Friday 6PM - Monday 5AM EDT.
+
+        Works on scalars or NumPy arrays (Monday=0, Sunday=6; minutes since midnight EDT).
+        """
+        friday_evening = (weekday == 4) & (minutes >= 18 * 60)
+        saturday_sunday = weekday >= 5
+        monday_early = (weekday == 0) & (minutes < 5 * 60)
+        return friday_evening | saturday_sunday | monday_early
+
     def _calc_first_response(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate first response times"""
 
@@ -341,42 +770,24 @@ class TicketDataProcessor:
         if not has_create_col:
             print("Warning: 'Create date' column not found, skipping first response calculation")
             df["First Response Time"] = pd.NaT
-            df["First Response Time (Hours)"] = pd.NA
+            df["First Response Time (Hours)"] = np.nan
             return df
 
-        def _delta(row):
-            # Handle Live Chat pipeline
-            if has_pipeline_col and "Pipeline" in row.index:
-                pipeline_val = row["Pipeline"]
-                if pipeline_val == "Live Chat ":
-                    return pd.Timedelta(seconds=30)
-
-            # Check required columns exist first
-            if not has_response_col:
-                return pd.NaT
-            
-            # Check Create date
-            if "Create date" not in row.index or pd.isna(row["Create date"]):
-                return pd.NaT
-            
-            # Check response date
-            if "First agent email response date" not in row.index or pd.isna(row["First agent email response date"]):
-                return pd.NaT
-
-            # Calculate response time
-            response_time = row["First agent email response date"] - row["Create date"]
-
-            # Validate that response time is positive (response after ticket creation)
-            if response_time.total_seconds() <= 0:
-                return pd.NaT  # Treat negative/zero response times as invalid
+        if has_response_col:
+            response_time = df["First agent email response date"] - df["Create date"]
+            # Validate that response time is positive (response after ticket creation);
+            # negative/zero response times are treated as invalid
+            response_time = response_time.mask(response_time <= pd.Timedelta(0))
+        else:
+            response_time = pd.Series(pd.NaT, index=df.index, dtype="timedelta64[ns]")
 
-            return response_time
+        # Handle Live Chat pipeline
+        if has_pipeline_col:
+            response_time = response_time.mask(df["Pipeline"] == "Live Chat ", pd.Timedelta(seconds=30))
 
-        df["First Response Time"] = df.apply(_delta, axis=1)
-        # Convert Timedelta to hours (use .total_seconds() on the values, not .dt accessor)
-        df["First Response Time (Hours)"] = df["First Response Time"].apply(
-            lambda x: x.total_seconds() / 3600 if pd.notna(x) else pd.NA
-        )
+        df["First Response Time"] = response_time
+        # Convert Timedelta to float hours; missing response times become NaN
+        df["First Response Time (Hours)"] = response_time.dt.total_seconds().div(3600)
         
         # Log validation results
         total_records = len(df)
@@ -392,17 +803,8 @@ class TicketDataProcessor:
         print(f"✅ Calculated first-response times for {valid_count:,} of {total_records:,} tickets")
         return df
     
-    def _remove_spam(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Remove SPAM tickets"""
-        pre_count = len(df)
-        df = df[df["Pipeline"] != "SPAM Tickets"].copy()
-        removed_count = pre_count - len(df)
-        print(f"Removed {removed_count:,} SPAM tickets.")
-        return df
-
-    def _remove_manager_tickets(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Remove manager tickets (Richie) - only include support team agents"""
-        pre_count = len(df)
+    def _apply_row_filters(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Remove SPAM tickets and manager tickets (Richie) in a single pass"""
         # Only include tickets from support team: Bhushan, Girly, Nova, Francis
         support_agents = ['Bhushan', 'Girly', 'Nova', 'Francis']
 
@@ -413,17 +815,36 @@ class TicketDataProcessor:
                 owner_col = col
                 break
 
+        not_spam = df["Pipeline"] != "SPAM Tickets"
         if owner_col:
-            df = df[df[owner_col].isin(support_agents)].copy()
-            removed_count = pre_count - len(df)
-            print(f"Removed {removed_count:,} manager tickets (non-support team).")
+            is_support = df[owner_col].isin(support_agents)
         else:
+            is_support = pd.Series(True, index=df.index)
             print("Warning: Could not find owner column to filter manager tickets.")
 
+        mask = not_spam & is_support
+        spam_count = int((~not_spam).sum())
+        # Manager tickets are counted among the non-SPAM rows, as before
+        manager_count = int((not_spam & ~is_support).sum())
+
+        # take() materialises the filtered frame once and, unlike df[mask],
+        # leaves it safe to add columns to without a defensive copy
+        df = df.take(np.flatnonzero(mask.to_numpy()))
+        for col in ("Pipeline", owner_col):
+            if col and isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].cat.remove_unused_categories()
+
+        print(f"Removed {spam_count:,} SPAM tickets.")
+        if owner_col:
+            print(f"Removed {manager_count:,} manager tickets (non-support team).")
+
         return df
     
     def generate_analytics(self, analysis_df: pd.DataFrame, args) -> Dict:
         """Generate ticket analytics and charts"""
+        # Charts are emitted into one page in order; only the first loads plotly.js / the weekly CSS
+        self._plotlyjs_included = False
+        self._weekly_css_included = False
         analytics = {
             'charts': [],
             'tables': [],
@@ -443,26 +864,34 @@ class TicketDataProcessor:
         
         # 4. Historic Daily Volume (back to start of 2025) - Use full dataset
         if self.df is not None and len(self.df) > 0:
-            full_df = self.df.copy()
-            full_df["Day"] = full_df["Create date"].dt.date
-            historic_day_counts = full_df["Day"].value_counts().sort_index()
+            # Count straight off the date column rather than copying the whole frame
+            historic_day_counts = self.df["Create date"].dt.normalize().value_counts().sort_index()
+            historic_day_counts.index = historic_day_counts.index.date
             if len(historic_day_counts) > 0:
                 analytics['charts'].append(self._create_historic_daily_volume_chart(historic_day_counts))
         
-        # Summary metrics - use the actual dashboard timeframe (analysis_df)
-        summary_df = analysis_df.copy()
+        # Summary metrics - use the actual dashboard timeframe (analysis_df); it is only
+        # read here, so the weekday/weekend/LiveChat splits are plain masks over it
+        summary_df = analysis_df
         
         total_tickets = len(summary_df)
         weekend_tickets = summary_df["Weekend_Ticket"].sum() if "Weekend_Ticket" in summary_df.columns else 0
         weekday_tickets = total_tickets - weekend_tickets
 
+        weekend_mask = analysis_df["Weekend_Ticket"].to_numpy(dtype=bool)
+        weekday_mask = ~weekend_mask
+
         # Response time analysis (weekdays only, excluding LiveChat)
-        weekday_df_summary = summary_df[summary_df["Weekend_Ticket"] == False] if "Weekend_Ticket" in summary_df.columns else summary_df
-        weekday_non_livechat = weekday_df_summary[weekday_df_summary["Pipeline"] != "Live Chat "] if "Pipeline" in weekday_df_summary.columns else weekday_df_summary
-        avg_response_weekday = weekday_non_livechat["First Response Time (Hours)"].median() if "First Response Time (Hours)" in weekday_non_livechat.columns else None
+        if "First Response Time (Hours)" in summary_df.columns:
+            response_mask = weekday_mask
+            if "Pipeline" in summary_df.columns:
+                response_mask = response_mask & (summary_df["Pipeline"] != "Live Chat ").to_numpy()
+            avg_response_weekday = summary_df.loc[response_mask, "First Response Time (Hours)"].median()
+        else:
+            avg_response_weekday = None
 
         # For charts and tables, continue using the user-selected analysis_df
-        weekday_df = analysis_df[analysis_df["Weekend_Ticket"] == False]
+        weekday_df = analysis_df[weekday_mask]
         
         # Find owner column for agent analysis
         owner_col = None
@@ -471,8 +900,7 @@ class TicketDataProcessor:
                 owner_col = col
                 break
         
-        weekend_df = analysis_df[analysis_df["Weekend_Ticket"] == True]
-        avg_response_weekend = weekend_df["First Response Time (Hours)"].mean()
+        avg_response_weekend = analysis_df.loc[weekend_mask, "First Response Time (Hours)"].mean()
         
         # Calculate actual date range and daily averages from the dashboard timeframe
         if len(summary_df) > 0 and 'Create date' in summary_df.columns:
@@ -535,13 +963,120 @@ class TicketDataProcessor:
         
         return analytics
     
+    @staticmethod
+    def _linear_fit(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+        """Closed-form least-squares (slope, intercept); same fit as ``np.polyfit(x, y, 1)``
+        without building the Vandermonde matrix."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        n = len(x)
+        sx = x.sum()
+        sy = y.sum()
+        slope = (n * (x @ y) - sx * sy) / (n * (x @ x) - sx * sx)
+        intercept = (sy - slope * sx) / n
+        return slope, intercept
+
+    @classmethod
+    def _linear_trend(cls, volumes: np.ndarray) -> np.ndarray:
+        """Least-squares trend line for evenly spaced daily values (x = 0..n-1)"""
+        x = np.arange(len(volumes), dtype=np.float64)
+        slope, intercept = cls._linear_fit(x, volumes)
+        return slope * x + intercept
+
+    def _week_starts(self) -> pd.Series:
+        """Monday (midnight EDT) of each ticket's week in self.df, cached per DataFrame"""
+        cached = self._week_start_cache
+        if cached is not None and cached[0] is self.df:
+            return cached[1]
+        dates = self.df["Create date"]
+        tz = dates.dt.tz
+        local = dates.dt.tz_localize(None) if tz is not None else dates
+        # Day buckets as datetime64[D]; 1970-01-01 was a Thursday, so (days + 3) % 7 is the Monday-based weekday
+        days = local.to_numpy().astype("datetime64[D]")
+        mondays = days - ((days.view("i8") + 3) % 7).astype("timedelta64[D]")
+        week_starts = pd.Series(mondays.astype("datetime64[ns]"), index=dates.index)
+        if tz is not None:
+            week_starts = week_starts.dt.tz_localize(tz)
+        self._week_start_cache = (self.df, week_starts)
+        return week_starts
+
+    def _agent_response_frame(self, df: pd.DataFrame, ticket_id_col: str) -> pd.DataFrame:
+        """Ticket IDs and first response hours of df with Live Chat rows blanked to NaN, cached per frame.
+        Grouping it by the owner column yields volume (all tickets) and response stats (non-LiveChat)
+        in one pass, without a second groupby and join or a copy of every column"""
+        cached = self._non_livechat_cache
+        if cached is not None and cached[0] is df:
+            return cached[1]
+        non_livechat = (df["Pipeline"] != "Live Chat ").to_numpy(dtype=bool)
+        frame = pd.DataFrame({
+            "Ticket_ID": df[ticket_id_col],
+            "Response_Hours": df["First Response Time (Hours)"].astype("float64").where(non_livechat),
+        })
+        self._non_livechat_cache = (df, frame)
+        return frame
+
+    def _weekly_response_stats(self) -> pd.DataFrame:
+        """Weekly median/mean/count of first response hours for all, weekday and weekend tickets
+        in self.df, cached per DataFrame (shared by the median and mean weekly charts)"""
+        cached = self._weekly_stats_cache
+        if cached is not None and cached[0] is self.df:
+            return cached[1]
+        weekend_mask = self.df["Weekend_Ticket"].to_numpy(dtype=bool)
+        response_hours = self.df["First Response Time (Hours)"]
+        weekly = pd.DataFrame({
+            "all": response_hours,
+            "weekday": response_hours.where(~weekend_mask),
+            "weekend": response_hours.where(weekend_mask),
+        }).groupby(self._week_starts().rename("Monday")).agg(["median", "mean", "count"])
+        self._weekly_stats_cache = (self.df, weekly)
+        return weekly
+
+    def _plotlyjs_mode(self):
+        """include_plotlyjs value for the next Plotly figure: CDN script once per dashboard"""
+        if self._plotlyjs_included:
+            return False
+        self._plotlyjs_included = True
+        return "cdn"
+
+    def _weekly_chart_css(self) -> str:
+        """Weekly chart control styles for the first weekly chart of a dashboard, empty afterwards"""
+        if self._weekly_css_included:
+            return ""
+        self._weekly_css_included = True
+        return _WEEKLY_CHART_CSS
+
+    def _emit_plotly(self, fig, div_id: str) -> str:
+        """Render a figure as a bare <div> plus a single Plotly.newPlot call on its JSON spec"""
+        return self._emit_plotly_spec(fig.to_json(), fig.layout.height, div_id)
+
+    def _emit_plotly_spec(self, spec: str, layout_height: Optional[int], div_id: str) -> str:
+        """Render an already serialised figure spec like _emit_plotly"""
+        script_tag = ""
+        if self._plotlyjs_mode() == "cdn":
+            script_tag = f'<script charset="utf-8" src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>'
+        height = f"{layout_height}px" if layout_height else "100%"
+        # Keep "</script>" inside string values from terminating the inline script
+        spec = spec.replace("</", "<\\/")
+        return (
+            f'{script_tag}<div id="{div_id}" class="plotly-graph-div" style="height:{height}; width:100%;"></div>'
+            f'<script type="text/javascript">(function() {{ var spec = {spec}; '
+            f'Plotly.newPlot("{div_id}", spec.data, spec.layout, {{"responsive": true}}); }})();</script>'
+        )
+
     def _create_pipeline_chart(self, analysis_df: pd.DataFrame) -> str:
         """Create modern Plotly pipeline distribution chart"""
+        # Get pipeline counts (categorical value_counts is a bincount over the codes;
+        # frames that bypassed _map_pipeline_names are converted here)
+        pipelines = analysis_df["Pipeline"]
+        if not isinstance(pipelines.dtype, pd.CategoricalDtype):
+            pipelines = pipelines.astype("category")
+        pipeline_counts = pipelines.value_counts()
+        pipeline_counts = pipeline_counts[pipeline_counts > 0]
+
         try:
-            import plotly.graph_objects as go
+            if not PLOTLY_AVAILABLE:
+                raise ImportError("Plotly not available")
             
-            # Get pipeline counts
-            pipeline_counts = analysis_df["Pipeline"].value_counts()
             
             # Create horizontal bar chart for better readability
             fig = go.Figure(data=[
@@ -560,10 +1095,7 @@ class TicketDataProcessor:
                 title='🎯 Tickets by Pipeline',
                 xaxis_title='Number of Tickets',
                 yaxis_title='Pipeline',
-                template='plotly_dark',
-                plot_bgcolor='rgba(30, 30, 46, 0.8)',
-                paper_bgcolor='rgba(23, 23, 35, 0.9)',
-                font=dict(color='#e0e0e0'),
+                **_DARK_LAYOUT,
                 height=400,
                 margin=dict(l=150, r=50, t=50, b=50),
                 xaxis=dict(gridcolor='rgba(102, 126, 234, 0.2)', showgrid=True),
@@ -572,20 +1104,18 @@ class TicketDataProcessor:
             
             return f'''
             <div class="chart-container">
-                {fig.to_html(include_plotlyjs="cdn")}
+                {self._emit_plotly(fig, "ticket-pipeline-chart")}
             </div>
             '''
             
         except ImportError:
             # Fallback to matplotlib if Plotly not available
-            import matplotlib.pyplot as plt
-            import seaborn as sns
             
             fig, ax = plt.subplots(figsize=(8, 6))
             sns.countplot(
                 y="Pipeline",
                 data=analysis_df,
-                order=analysis_df["Pipeline"].value_counts().index,
+                order=pipeline_counts.index,
                 ax=ax,
             )
             ax.set_title("Tickets by Pipeline")
@@ -595,7 +1125,8 @@ class TicketDataProcessor:
     def _create_weekend_distribution_chart(self, analysis_df: pd.DataFrame) -> str:
         """Create modern Plotly weekend/weekday distribution pie chart"""
         try:
-            import plotly.graph_objects as go
+            if not PLOTLY_AVAILABLE:
+                raise ImportError("Plotly not available")
             
             # Get weekend distribution
             weekend_counts = analysis_df["Weekend_Ticket"].value_counts()
@@ -617,10 +1148,7 @@ class TicketDataProcessor:
             
             fig.update_layout(
                 title='📅 Weekday vs Weekend Distribution',
-                template='plotly_dark',
-                plot_bgcolor='rgba(30, 30, 46, 0.8)',
-                paper_bgcolor='rgba(23, 23, 35, 0.9)',
-                font=dict(color='#e0e0e0'),
+                **_DARK_LAYOUT,
                 height=400,
                 showlegend=True,
                 legend=dict(
@@ -634,13 +1162,12 @@ class TicketDataProcessor:
             
             return f'''
             <div class="chart-container">
-                {fig.to_html(include_plotlyjs="cdn")}
+                {self._emit_plotly(fig, "ticket-weekend-distribution-chart")}
             </div>
             '''
             
         except ImportError:
             # Fallback to matplotlib if Plotly not available
-            import matplotlib.pyplot as plt
             
             fig, ax = plt.subplots(figsize=(6, 6))
             weekend_counts = analysis_df["Weekend_Ticket"].value_counts()
@@ -677,33 +1204,28 @@ class TicketDataProcessor:
         if not owner_col:
             return "<p>No owner column found for agent analysis</p>"
         
-        # Filter out LiveChat tickets for response time calculations
-        non_livechat_df = weekday_df[weekday_df["Pipeline"] != "Live Chat "].copy()
-        
         # Enhanced agent statistics with volume breakdowns (excluding LiveChat for response times)
-        agent_stats = weekday_df.groupby(owner_col).agg({
-            ticket_id_col: "count",
-            "Pipeline": lambda x: x.value_counts().to_dict()  # Pipeline breakdown
-        })
+        agent_stats = self._agent_response_frame(weekday_df, ticket_id_col).groupby(
+            weekday_df[owner_col], observed=True
+        ).agg(
+            Tickets_Handled=("Ticket_ID", "count"),
+            Avg_Response_Time=("Response_Hours", "mean"),
+            Median_Response_Time=("Response_Hours", "median"),
+            Response_Time_Std=("Response_Hours", "std"),
+        )
         
-        # Calculate response time stats excluding LiveChat tickets
-        if len(non_livechat_df) > 0:
-            # Convert pd.NA to np.nan for aggregation compatibility
-            non_livechat_df = non_livechat_df.copy()
-            non_livechat_df["First Response Time (Hours)"] = non_livechat_df["First Response Time (Hours)"].replace({pd.NA: np.nan})
-
-            response_stats = non_livechat_df.groupby(owner_col)["First Response Time (Hours)"].agg(["mean", "median", "std"])
-            response_stats.columns = ["Avg_Response_Time", "Median_Response_Time", "Response_Time_Std"]
-            agent_stats = agent_stats.join(response_stats, how='left')
+        # Pipeline breakdown: top pipeline per agent plus how many others they handled
+        pipeline_counts = weekday_df.groupby([owner_col, "Pipeline"], observed=True).size().unstack(fill_value=0)
+        if len(pipeline_counts) > 0:
+            top_count = pipeline_counts.max(axis=1)
+            other_pipelines = (pipeline_counts > 0).sum(axis=1) - 1
+            pipeline_text = pipeline_counts.idxmax(axis=1).astype(str) + " (" + top_count.astype(str) + ")"
+            pipeline_text = pipeline_text.where(
+                other_pipelines == 0, pipeline_text + " +" + other_pipelines.astype(str) + " more"
+            )
+            agent_stats["Pipeline_Text"] = pipeline_text.reindex(agent_stats.index).fillna("No data")
         else:
-            agent_stats["Avg_Response_Time"] = float('nan')
-            agent_stats["Median_Response_Time"] = float('nan')
-            agent_stats["Response_Time_Std"] = float('nan')
-        
-        # Flatten column names - now they should already be flat
-        if isinstance(agent_stats.columns, pd.MultiIndex):
-            agent_stats.columns = agent_stats.columns.droplevel(1)
-        agent_stats.columns = ["Tickets_Handled", "Pipeline_Breakdown", "Avg_Response_Time", "Median_Response_Time", "Response_Time_Std"]
+            agent_stats["Pipeline_Text"] = "No data"
         
         # Add percentage of total tickets
         total_tickets = len(weekday_df)
@@ -715,41 +1237,32 @@ class TicketDataProcessor:
         
         # Clean up data types
         agent_stats["Tickets_Handled"] = agent_stats["Tickets_Handled"].astype(int)
-        agent_stats["Avg_Response_Time"] = agent_stats["Avg_Response_Time"].round(2)
-        agent_stats["Median_Response_Time"] = agent_stats["Median_Response_Time"].round(2)
-        agent_stats["Response_Time_Std"] = agent_stats["Response_Time_Std"].round(2)
+        time_cols = ["Avg_Response_Time", "Median_Response_Time", "Response_Time_Std"]
+        agent_stats[time_cols] = np.round(agent_stats[time_cols].to_numpy(dtype=float), 2)
         
         # Sort by tickets handled
         agent_stats = agent_stats.sort_values("Tickets_Handled", ascending=False)
         
-        rows = []
-        for agent, row in agent_stats.iterrows():
-            # Format response time data
-            avg_time = f"{row['Avg_Response_Time']:.2f}h" if pd.notna(row['Avg_Response_Time']) else "No data"
-            median_time = f"{row['Median_Response_Time']:.2f}h" if pd.notna(row['Median_Response_Time']) else "No data"
-            
-            # Format pipeline breakdown
-            pipeline_breakdown = row['Pipeline_Breakdown']
-            if isinstance(pipeline_breakdown, dict) and pipeline_breakdown:
-                top_pipeline = max(pipeline_breakdown, key=pipeline_breakdown.get)
-                top_count = pipeline_breakdown[top_pipeline]
-                pipeline_text = f"{top_pipeline} ({top_count})"
-                if len(pipeline_breakdown) > 1:
-                    pipeline_text += f" +{len(pipeline_breakdown)-1} more"
-            else:
-                pipeline_text = "No data"
-            
-            rows.append(f"""
-            <tr>
-                <td style="font-weight:bold">{agent}</td>
-                <td style="text-align:center">{row['Tickets_Handled']}</td>
-                <td style="text-align:center">{row['Percentage_of_Total']:.1f}%</td>
-                <td style="text-align:center">{row['Daily_Average']:.1f}</td>
-                <td style="text-align:center">{avg_time}</td>
-                <td style="text-align:center">{median_time}</td>
-                <td style="font-size:0.85em; max-width:200px; overflow:hidden; text-overflow:ellipsis;">{pipeline_text}</td>
-            </tr>
-            """)
+        # Pre-format numeric columns column-wise, then render every row from one template
+        def _format_hours(values: pd.Series) -> pd.Series:
+            return values.map(lambda v: f"{v:.2f}h" if pd.notna(v) else "No data")
+
+        columns = zip(
+            agent_stats.index.to_numpy(),
+            agent_stats["Tickets_Handled"].to_numpy(),
+            agent_stats["Percentage_of_Total"].map("{:.1f}".format).to_numpy(),
+            agent_stats["Daily_Average"].map("{:.1f}".format).to_numpy(),
+            _format_hours(agent_stats["Avg_Response_Time"]).to_numpy(),
+            _format_hours(agent_stats["Median_Response_Time"]).to_numpy(),
+            agent_stats["Pipeline_Text"].to_numpy(),
+        )
+        rows = [
+            _AGENT_ROW_TEMPLATE.format(
+                agent=agent, tickets=tickets, percentage=percentage, daily_average=daily_average,
+                avg_time=avg_time, median_time=median_time, pipeline_text=pipeline_text,
+            )
+            for agent, tickets, percentage, daily_average, avg_time, median_time, pipeline_text in columns
+        ]
         
         # Create summary row
         total_summary = f"""
@@ -762,43 +1275,19 @@ class TicketDataProcessor:
         </tr>
         """
         
-        return f"""
-        <div class="section">
-            <h2>Agent Performance & Volume Breakdown (Weekdays Only)</h2>
-            <div style="margin-bottom: 10px; color: #e0e0e0; font-size: 0.9em;">
-                📊 Volume analysis across {date_range_days} day(s) • {len(agent_stats)} active agents • Response times exclude LiveChat tickets
-            </div>
-            <div class="table-container">
-                <table class="performance-table">
-                    <thead>
-                        <tr>
-                            <th>Agent</th>
-                            <th>Total<br>Tickets</th>
-                            <th>% of<br>Total</th>
-                            <th>Daily<br>Avg</th>
-                            <th>Avg Response<br>Time (excl. LiveChat)</th>
-                            <th>Median Response<br>Time (excl. LiveChat)</th>
-                            <th>Top Pipeline</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {''.join(rows)}
-                        {total_summary}
-                    </tbody>
-                </table>
-            </div>
-            <div style="margin-top: 10px; color: #999; font-size: 0.8em; font-style: italic;">
-                💡 Tip: Higher volume agents may show different response time patterns due to workload distribution.
-            </div>
-        </div>
-        """
+        return (
+            _AGENT_TABLE_HEADER.format(date_range_days=date_range_days, n_agents=len(agent_stats))
+            + "".join(rows)
+            + total_summary
+            + _AGENT_TABLE_FOOTER
+        )
     
     def _create_agent_performance_charts(self, weekday_df: pd.DataFrame) -> List[str]:
         """Create enhanced agent performance charts with volume breakdowns - Always use Plotly for consistency"""
         try:
             # Always use Plotly for consistency with chat analytics
-            import plotly.graph_objects as go
-            from plotly.subplots import make_subplots
+            if not PLOTLY_AVAILABLE:
+                raise ImportError("Plotly not available")
             return self._create_interactive_agent_charts(weekday_df)
             
         except ImportError:
@@ -811,9 +1300,6 @@ class TicketDataProcessor:
     def _create_matplotlib_agent_charts_fallback(self, weekday_df: pd.DataFrame) -> List[str]:
         """Fallback matplotlib agent charts (only used if Plotly unavailable)"""
         try:
-            import numpy as np
-            import matplotlib.pyplot as plt
-            
             # Find ticket ID column
             ticket_id_col = None
             for col in ["Ticket number", "Ticket ID", "ID"]:
@@ -834,35 +1320,17 @@ class TicketDataProcessor:
             if not owner_col:
                 return []
             
-            # Filter out LiveChat tickets for response time calculations
-            non_livechat_df = weekday_df[weekday_df["Pipeline"] != "Live Chat "].copy()
-            
             # Calculate enhanced agent statistics for charts (volume from all tickets, response times excluding LiveChat)
-            agent_stats = weekday_df.groupby(owner_col).agg({
-                ticket_id_col: "count",
-                "Pipeline": lambda x: x.value_counts().to_dict()
-            })
-            
-            # Calculate response time stats excluding LiveChat tickets
-            if len(non_livechat_df) > 0:
-                # Convert pd.NA to np.nan for aggregation compatibility
-                non_livechat_df = non_livechat_df.copy()
-                non_livechat_df["First Response Time (Hours)"] = non_livechat_df["First Response Time (Hours)"].replace({pd.NA: np.nan})
-
-                response_stats = non_livechat_df.groupby(owner_col)["First Response Time (Hours)"].agg(["mean", "median"])
-                response_stats.columns = ["Avg_Response_Time", "Median_Response_Time"]
-                agent_stats = agent_stats.join(response_stats, how='left')
-            else:
-                agent_stats["Avg_Response_Time"] = float('nan')
-                agent_stats["Median_Response_Time"] = float('nan')
-            
-            # Flatten columns - now they should already be flat
-            if isinstance(agent_stats.columns, pd.MultiIndex):
-                agent_stats.columns = agent_stats.columns.droplevel(1)
-            agent_stats.columns = ["Tickets_Handled", "Pipeline_Breakdown", "Avg_Response_Time", "Median_Response_Time"]
+            agent_stats = self._agent_response_frame(weekday_df, ticket_id_col).groupby(
+                weekday_df[owner_col], observed=True
+            ).agg(
+                Tickets_Handled=("Ticket_ID", "count"),
+                Avg_Response_Time=("Response_Hours", "mean"),
+                Median_Response_Time=("Response_Hours", "median"),
+            )
             agent_stats["Tickets_Handled"] = agent_stats["Tickets_Handled"].astype(int)
-            agent_stats["Avg_Response_Time"] = agent_stats["Avg_Response_Time"].round(2)
-            agent_stats["Median_Response_Time"] = agent_stats["Median_Response_Time"].round(2)
+            time_cols = ["Avg_Response_Time", "Median_Response_Time"]
+            agent_stats[time_cols] = np.round(agent_stats[time_cols].to_numpy(dtype=float), 2)
             
             # Add percentage calculation
             total_tickets = len(weekday_df)
@@ -886,12 +1354,11 @@ class TicketDataProcessor:
             ax1a.grid(axis='y', alpha=0.3)
             
             # Add value labels with percentages
-            for bar, (agent, row) in zip(bars1a, agent_stats.iterrows()):
-                height = bar.get_height()
-                percentage = row["Percentage"]
-                ax1a.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                        f'{int(height)}\n({percentage:.1f}%)',
-                        ha='center', va='bottom', fontweight='bold', fontsize=9)
+            volume_labels = [
+                f'{int(tickets)}\n({percentage:.1f}%)'
+                for tickets, percentage in zip(agent_stats["Tickets_Handled"].to_numpy(), agent_stats["Percentage"].to_numpy())
+            ]
+            ax1a.bar_label(bars1a, labels=volume_labels, padding=2, fontweight='bold', fontsize=9)
             
             ax1a.tick_params(axis='x', rotation=45, labelsize=9)
             
@@ -899,157 +1366,73 @@ class TicketDataProcessor:
             colors = ['#6366f1', '#ec4899', '#10b981', '#f59e0b', '#8b5cf6', '#06b6d4', '#84cc16', '#f97316']
             pie_colors = colors[:len(agent_stats)]
             
-            wedges, texts, autotexts = ax1b.pie(agent_stats["Percentage"],
-                                              labels=agent_stats.index,
-                                              colors=pie_colors,
-                                              autopct='%1.1f%%',
-                                              startangle=90)
+            # Pie label placement gets slow and unreadable for many agents; use bars instead
+            if len(agent_stats) <= 8:
+                wedges, texts, autotexts = ax1b.pie(agent_stats["Percentage"],
+                                                  labels=agent_stats.index,
+                                                  colors=pie_colors,
+                                                  autopct='%1.1f%%',
+                                                  pctdistance=0.75,
+                                                  wedgeprops=dict(linewidth=0),
+                                                  startangle=90)
+                
+                # Adjust text properties
+                for autotext in autotexts:
+                    autotext.set_color('white')
+                    autotext.set_fontweight('bold')
+                    autotext.set_fontsize(8)
+                for text in texts:
+                    text.set_fontsize(8)
+            else:
+                ax1b.barh(agent_stats.index[::-1], agent_stats["Percentage"][::-1], color='#6366f1', alpha=0.8)
+                ax1b.set_xlabel('Share of Tickets (%)', fontsize=10)
+                ax1b.tick_params(axis='y', labelsize=8)
             ax1b.set_title('📈 Volume Distribution', fontsize=12, fontweight='bold')
             
-            # Adjust text properties
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontweight('bold')
-                autotext.set_fontsize(8)
-            for text in texts:
-                text.set_fontsize(8)
-            
-            plt.tight_layout()
-            charts.append(fig_to_html(fig1))
-            
-            # Chart 2: Response Time Comparison (Average vs Median)
-            fig2, ax2 = plt.subplots(figsize=(12, 6))
-            x_pos = np.arange(len(agent_stats))
-            width = 0.35
-
-            # Fill NA values with 0 for plotting
-            avg_times = agent_stats["Avg_Response_Time"].fillna(0)
-            median_times = agent_stats["Median_Response_Time"].fillna(0)
-
-            bars2a = ax2.bar(x_pos - width/2, avg_times, width,
-                           label='Average', color='#ec4899', alpha=0.8)
-            bars2b = ax2.bar(x_pos + width/2, median_times, width,
-                           label='Median', color='#10b981', alpha=0.8)
-            
-            ax2.set_title('⏱️ Response Time Analysis: Average vs Median by Agent', fontsize=14, fontweight='bold', pad=20)
-            ax2.set_xlabel('Agent', fontsize=12)
-            ax2.set_ylabel('Response Time (Hours)', fontsize=12)
-            ax2.set_xticks(x_pos)
-            ax2.set_xticklabels(agent_stats.index, rotation=45, ha='right')
-            ax2.grid(axis='y', alpha=0.3)
-            ax2.legend()
-            
-            # Add value labels on bars
-            for bars, values in [(bars2a, avg_times), (bars2b, median_times)]:
-                for bar, value in zip(bars, values):
-                    height = bar.get_height()
-                    if height > 0:  # Only show label if value exists
-                        ax2.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                                f'{height:.2f}h', ha='center', va='bottom', fontweight='bold', fontsize=8)
-            
-            plt.tight_layout()
-            charts.append(fig_to_html(fig2))
-            
-            return charts
-            
-        except Exception as e:
-            print(f"Error creating matplotlib fallback agent charts: {e}")
-            return []
-    
-    def _create_daily_volume_chart(self, day_counts: pd.Series) -> str:
-        """Create daily ticket volume chart"""
-        try:
-            import plotly.graph_objects as go
-            
-            # Convert the series to a format suitable for plotting
-            dates = day_counts.index
-            volumes = day_counts.values
-            
-            # Create the Plotly bar chart
-            fig = go.Figure(data=go.Bar(
-                x=dates,
-                y=volumes,
-                name='Daily Ticket Volume',
-                marker_color='rgba(78, 205, 196, 0.8)',
-                text=volumes,
-                textposition='outside'
-            ))
-            
-            fig.update_layout(
-                title='📊 Daily Ticket Volume',
-                xaxis_title='Date',
-                yaxis_title='Number of Tickets',
-                template='plotly_dark',
-                plot_bgcolor='rgba(30, 30, 46, 0.8)',
-                paper_bgcolor='rgba(23, 23, 35, 0.9)',
-                font=dict(color='#e0e0e0'),
-                height=400,
-                margin=dict(l=50, r=50, t=50, b=50),
-                xaxis=dict(gridcolor='rgba(102, 126, 234, 0.2)', showgrid=True),
-                yaxis=dict(gridcolor='rgba(102, 126, 234, 0.2)', showgrid=True),
-                showlegend=False
-            )
-            
-            return f"""
-            <div class="section">
-                <h3>📊 Daily Ticket Volume</h3>
-                <div class="chart">
-                    {fig.to_html(include_plotlyjs="cdn")}
-                </div>
-            </div>
-            """
-            
-        except ImportError:
-            print("Plotly not available, falling back to static chart")
-            return self._create_matplotlib_daily_volume_fallback(day_counts)
-        except Exception as e:
-            print(f"Error creating daily volume chart: {e}")
-            return ""
-
-    def _create_matplotlib_daily_volume_fallback(self, day_counts: pd.Series) -> str:
-        """Fallback matplotlib daily volume chart"""
-        try:
-            import matplotlib.pyplot as plt
-            import numpy as np
-            
-            fig, ax = plt.subplots(figsize=(12, 6))
-            dates = day_counts.index
-            volumes = day_counts.values
+            plt.tight_layout()
+            charts.append(fig_to_html(fig1))
             
-            # Create bar chart
-            bars = ax.bar(dates, volumes, color='#4ecdc4', alpha=0.8)
+            # Chart 2: Response Time Comparison (Average vs Median)
+            fig2, ax2 = plt.subplots(figsize=(12, 6))
+            x_pos = np.arange(len(agent_stats))
+            width = 0.35
+
+            # Fill NA values with 0 for plotting
+            avg_times = agent_stats["Avg_Response_Time"].fillna(0)
+            median_times = agent_stats["Median_Response_Time"].fillna(0)
+
+            bars2a = ax2.bar(x_pos - width/2, avg_times, width,
+                           label='Average', color='#ec4899', alpha=0.8)
+            bars2b = ax2.bar(x_pos + width/2, median_times, width,
+                           label='Median', color='#10b981', alpha=0.8)
             
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                       f'{int(height)}', ha='center', va='bottom')
-            
-            ax.set_title('Daily Ticket Volume', fontsize=16, fontweight='bold')
-            ax.set_xlabel('Date')
-            ax.set_ylabel('Number of Tickets')
-            ax.grid(True, alpha=0.3)
+            ax2.set_title('⏱️ Response Time Analysis: Average vs Median by Agent', fontsize=14, fontweight='bold', pad=20)
+            ax2.set_xlabel('Agent', fontsize=12)
+            ax2.set_ylabel('Response Time (Hours)', fontsize=12)
+            ax2.set_xticks(x_pos)
+            ax2.set_xticklabels(agent_stats.index, rotation=45, ha='right')
+            ax2.grid(axis='y', alpha=0.3)
+            ax2.legend()
+            
+            # Add value labels on bars (only where a value exists)
+            for bars, values in [(bars2a, avg_times), (bars2b, median_times)]:
+                time_labels = [f'{value:.2f}h' if value > 0 else '' for value in values.to_numpy()]
+                ax2.bar_label(bars, labels=time_labels, padding=1, fontweight='bold', fontsize=8)
             
-            # Rotate x-axis labels for better readability
-            plt.xticks(rotation=45)
             plt.tight_layout()
+            charts.append(fig_to_html(fig2))
             
-            from common_utils import fig_to_html
-            return f"""
-            <div class="section">
-                <h3>📊 Daily Ticket Volume</h3>
-                {fig_to_html(fig, "chart")}
-            </div>
-            """
+            return charts
             
         except Exception as e:
-            print(f"Error creating fallback daily volume chart: {e}")
-            return ""
-
+            print(f"Error creating matplotlib fallback agent charts: {e}")
+            return []
+    
     def _create_daily_volume_chart(self, day_counts: pd.Series) -> str:
         """Create daily ticket volume chart"""
         try:
-            import plotly.graph_objects as go
+            if not PLOTLY_AVAILABLE:
+                raise ImportError("Plotly not available")
             
             # Convert the series to a format suitable for plotting
             dates = day_counts.index
@@ -1061,7 +1444,7 @@ class TicketDataProcessor:
                 y=volumes,
                 name='Daily Ticket Volume',
                 marker_color='rgba(78, 205, 196, 0.8)',
-                text=volumes,
+                text=np.char.mod('%d', volumes),
                 textposition='outside'
             ))
             
@@ -1069,10 +1452,7 @@ class TicketDataProcessor:
                 title='📊 Daily Ticket Volume',
                 xaxis_title='Date',
                 yaxis_title='Number of Tickets',
-                template='plotly_dark',
-                plot_bgcolor='rgba(30, 30, 46, 0.8)',
-                paper_bgcolor='rgba(23, 23, 35, 0.9)',
-                font=dict(color='#e0e0e0'),
+                **_DARK_LAYOUT,
                 height=400,
                 margin=dict(l=50, r=50, t=50, b=50),
                 xaxis=dict(gridcolor='rgba(102, 126, 234, 0.2)', showgrid=True),
@@ -1084,7 +1464,7 @@ class TicketDataProcessor:
             <div class="section">
                 <h3>📊 Daily Ticket Volume</h3>
                 <div class="chart">
-                    {fig.to_html(include_plotlyjs="cdn")}
+                    {self._emit_plotly(fig, "ticket-daily-volume-chart")}
                 </div>
             </div>
             """
@@ -1099,9 +1479,6 @@ class TicketDataProcessor:
     def _create_matplotlib_daily_volume_fallback(self, day_counts: pd.Series) -> str:
         """Fallback matplotlib daily volume chart"""
         try:
-            import matplotlib.pyplot as plt
-            import numpy as np
-            
             fig, ax = plt.subplots(figsize=(12, 6))
             dates = day_counts.index
             volumes = day_counts.values
@@ -1116,10 +1493,7 @@ class TicketDataProcessor:
             ax.grid(True, alpha=0.3)
             
             # Add value labels on bars
-            for bar, value in zip(bars, volumes):
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                       f'{int(value)}', ha='center', va='bottom')
+            ax.bar_label(bars, labels=[f'{int(value)}' for value in volumes], padding=1)
             
             # Format x-axis dates
             fig.autofmt_xdate()
@@ -1145,7 +1519,8 @@ class TicketDataProcessor:
     def _create_historic_daily_volume_chart(self, historic_day_counts: pd.Series) -> str:
         """Create historic daily volume chart showing all data back to start of 2025"""
         try:
-            import plotly.graph_objects as go
+            if not PLOTLY_AVAILABLE:
+                raise ImportError("Plotly not available")
             
             # Convert the series to a format suitable for plotting
             dates = historic_day_counts.index
@@ -1160,16 +1535,13 @@ class TicketDataProcessor:
                 y=volumes,
                 name='Daily Tickets',
                 marker_color='rgba(78, 205, 196, 0.8)',
-                text=volumes,
+                text=np.char.mod('%d', volumes),
                 textposition='outside'
             ))
             
             # Add trend line
-            import numpy as np
-            x_values = np.arange(len(dates))
             if len(dates) > 1:
-                slope, intercept = np.polyfit(x_values, volumes, 1)
-                trend_y = slope * x_values + intercept
+                trend_y = np.round(self._linear_trend(volumes), 3)  # display precision keeps the JSON spec compact
                 
                 fig.add_trace(go.Scatter(
                     x=dates,
@@ -1184,10 +1556,7 @@ class TicketDataProcessor:
                 title=f'📈 Historic Daily Ticket Volume (Since 2025)',
                 xaxis_title='Date',
                 yaxis_title='Number of Tickets',
-                template='plotly_dark',
-                plot_bgcolor='rgba(30, 30, 46, 0.8)',
-                paper_bgcolor='rgba(23, 23, 35, 0.9)',
-                font=dict(color='#e0e0e0'),
+                **_DARK_LAYOUT,
                 height=450,
                 margin=dict(l=50, r=50, t=60, b=50),
                 xaxis=dict(gridcolor='rgba(102, 126, 234, 0.2)', showgrid=True),
@@ -1199,7 +1568,7 @@ class TicketDataProcessor:
             <div class="section">
                 <h3>📈 Historic Daily Ticket Volume</h3>
                 <div class="chart">
-                    {fig.to_html(include_plotlyjs="cdn")}
+                    {self._emit_plotly(fig, "ticket-historic-volume-chart")}
                 </div>
             </div>
             """
@@ -1214,9 +1583,6 @@ class TicketDataProcessor:
     def _create_matplotlib_historic_daily_fallback(self, historic_day_counts: pd.Series) -> str:
         """Fallback matplotlib historic daily volume chart"""
         try:
-            import matplotlib.pyplot as plt
-            import numpy as np
-            
             fig, ax = plt.subplots(figsize=(14, 6))
             dates = historic_day_counts.index
             volumes = historic_day_counts.values
@@ -1225,10 +1591,8 @@ class TicketDataProcessor:
             bars = ax.bar(dates, volumes, color='#4ecdc4', alpha=0.8, width=0.8)
             
             # Add trend line
-            x_values = np.arange(len(dates))
             if len(dates) > 1:
-                slope, intercept = np.polyfit(x_values, volumes, 1)
-                trend_y = slope * x_values + intercept
+                trend_y = self._linear_trend(volumes)
                 ax.plot(dates, trend_y, color='#ff6b6b', linewidth=2, label='Trend Line')
             
             # Styling
@@ -1280,7 +1644,8 @@ class TicketDataProcessor:
                 return ""
             
             # Always use Plotly for consistency with chat analytics
-            import plotly.graph_objects as go
+            if not PLOTLY_AVAILABLE:
+                raise ImportError("Plotly not available")
 
             # Build both chart variants but show only one via UI (Median by default).
             # Note: weekend series/bars are hidden by default; toggles remain visible.
@@ -1376,17 +1741,12 @@ class TicketDataProcessor:
     def _create_matplotlib_weekly_chart_fallback(self, analysis_df: pd.DataFrame) -> str:
         """Fallback matplotlib weekly chart (only used if Plotly unavailable)"""
         try:
-            from datetime import datetime, timedelta
-            import numpy as np
-            from scipy import stats
-            import matplotlib.pyplot as plt
-            
             # Use the filtered analysis_df for the selected period, not the full dataset
             if analysis_df is None or len(analysis_df) == 0:
                 return ""
             
             # Use the full dataset to show all weeks of 2025, regardless of analysis period
-            df_all = self.df.copy()
+            df_all = self.df
             
             # Get actual date range from full data
             min_date = df_all["Create date"].min()
@@ -1396,38 +1756,24 @@ class TicketDataProcessor:
                 return ""
             
             # Get Monday of each week - use naive datetime for consistency
-            df_all['Monday'] = df_all["Create date"].dt.normalize().apply(
-                lambda x: x - timedelta(days=x.weekday())
-            )
-            
-            # Calculate comprehensive weekly stats for ALL ticket types (mean for consistency)
-            weekly_stats_all = df_all.groupby('Monday').agg({
-                'First Response Time (Hours)': 'median'
-            }).reset_index()
-            weekly_stats_all.columns = ['Monday', 'All_Tickets']
-            
-            # Calculate weekly stats for WEEKDAY ONLY tickets (mean for consistency)
-            df_weekday = df_all[df_all["Weekend_Ticket"] == False].copy()
-            weekly_stats_weekday = df_weekday.groupby('Monday').agg({
-                'First Response Time (Hours)': 'median'
-            }).reset_index()
-            weekly_stats_weekday.columns = ['Monday', 'Weekday_Only']
-            
-            # Calculate weekly stats for WEEKEND ONLY tickets (mean for consistency)
-            df_weekend = df_all[df_all["Weekend_Ticket"] == True].copy()
-            weekly_stats_weekend = df_weekend.groupby('Monday').agg({
-                'First Response Time (Hours)': 'median'
+            monday = self._week_starts().rename('Monday')
+            response_hours = df_all['First Response Time (Hours)']
+            is_weekend = df_all["Weekend_Ticket"].astype(bool)
+            
+            # Weekly medians for ALL tickets, then WEEKDAY ONLY / WEEKEND ONLY split in one grouping
+            # (groupby output is already sorted by Monday, so the columns align without a join)
+            weekly_split = response_hours.groupby([monday, is_weekend]).median().unstack('Weekend_Ticket')
+            weekly_split = weekly_split.reindex(columns=[False, True])
+            weekly_stats = pd.DataFrame({
+                'All_Tickets': response_hours.groupby(monday).median(),
+                'Weekday_Only': weekly_split[False],
+                'Weekend_Only': weekly_split[True],
             }).reset_index()
-            weekly_stats_weekend.columns = ['Monday', 'Weekend_Only']
             
             # Calculate overall means (constant lines across all weeks)
-            overall_mean_all = df_all['First Response Time (Hours)'].median()
-            overall_mean_weekday = df_weekday['First Response Time (Hours)'].median()
-            overall_mean_weekend = df_weekend['First Response Time (Hours)'].median() if len(df_weekend) > 0 else None
-            
-            # Merge all datasets
-            weekly_stats = weekly_stats_all.merge(weekly_stats_weekday, on='Monday', how='left')
-            weekly_stats = weekly_stats.merge(weekly_stats_weekend, on='Monday', how='left')
+            overall_mean_all = response_hours.median()
+            overall_mean_weekday = response_hours[~is_weekend].median()
+            overall_mean_weekend = response_hours[is_weekend].median() if is_weekend.any() else None
             
             # Add overall mean columns (constant values for trend lines)
             weekly_stats['Median_All_Tickets'] = overall_mean_all
@@ -1438,8 +1784,8 @@ class TicketDataProcessor:
             if len(weekly_stats) == 0:
                 return ""
             
-            # Sort by Monday date
-            weekly_stats = weekly_stats.sort_values('Monday')
+            # Format week labels once; the 8/12-week variants reuse the tail rows
+            weekly_stats['Week_Label'] = weekly_stats['Monday'].dt.strftime('%m/%d')
             
             # Generate charts for different week ranges
             chart_all = self._generate_weekly_chart_variant(weekly_stats, "all", min_date, max_date)
@@ -1507,103 +1853,27 @@ class TicketDataProcessor:
                     </div>
                 </div>
                 
-                <div id="weekly-chart-all" class="weekly-chart-container" style="display: block;">
+                <div id="weekly-chart-all" class="weekly-chart-container weekly-variant active">
                     {chart_all}
                 </div>
-                <div id="weekly-chart-12" class="weekly-chart-container" style="display: none;">
+                <div id="weekly-chart-12" class="weekly-chart-container weekly-variant">
                     {chart_12}
                 </div>
-                <div id="weekly-chart-8" class="weekly-chart-container" style="display: none;">
+                <div id="weekly-chart-8" class="weekly-chart-container weekly-variant">
                     {chart_8}
                 </div>
             </div>
             
-            <style>
-            .week-toggle-controls {{
-                display: flex;
-                gap: 8px;
-                align-items: center;
-            }}
-            .week-toggle-btn {{
-                background: linear-gradient(135deg, #667eea, #764ba2);
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-size: 0.85em;
-                cursor: pointer;
-                transition: all 0.2s ease;
-                opacity: 0.7;
-                font-weight: 500;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-            }}
-            .week-toggle-btn:hover {{
-                opacity: 1;
-                transform: translateY(-1px);
-                box-shadow: 0 4px 8px rgba(0,0,0,0.3);
-            }}
-            .week-toggle-btn.active {{
-                opacity: 1;
-                background: linear-gradient(135deg, #00d4aa, #36d1dc);
-                box-shadow: 0 3px 6px rgba(0,212,170,0.4);
-                font-weight: bold;
-                transform: translateY(-1px);
-            }}
-            .weekly-chart-container {{
-                margin: 15px 0;
-                background: rgba(23, 23, 35, 0.6);
-                border-radius: 10px;
-                padding: 15px;
-                border: 1px solid rgba(102, 126, 234, 0.2);
-                box-shadow: 0 4px 8px rgba(0,0,0,0.3);
-            }}
-            .bar-type-controls {{
-                background: rgba(45, 52, 54, 0.8);
-                padding: 15px;
-                border-radius: 10px;
-                border: 1px solid rgba(255,255,255,0.15);
-                min-width: 300px;
-                box-shadow: 0 2px 6px rgba(0,0,0,0.2);
-            }}
-            .bar-controls-grid {{
-                display: grid;
-                grid-template-columns: 1fr 1fr;
-                gap: 10px;
-                font-size: 0.85em;
-            }}
-            .bar-control {{
-                display: flex;
-                align-items: center;
-                gap: 8px;
-                color: #e0e0e0;
-                cursor: pointer;
-                padding: 6px 8px;
-                border-radius: 6px;
-                transition: all 0.2s ease;
-                font-weight: 500;
-            }}
-            .bar-control:hover {{
-                background-color: rgba(255,255,255,0.15);
-                transform: translateX(2px);
-            }}
-            .bar-toggle {{
-                accent-color: #00d4aa;
-                width: 16px;
-                height: 16px;
-                cursor: pointer;
-            }}
-            </style>
+            {self._weekly_chart_css()}
             
             <script>
             function showWeeklyChart(weeks) {{
-                // Hide all charts
-                document.querySelectorAll('.weekly-chart-container').forEach(container => {{
-                    container.style.display = 'none';
+                // Show only the selected range variant (one class flip per container, no inline style writes)
+                const targetId = 'weekly-chart-' + weeks;
+                document.querySelectorAll('.weekly-variant').forEach(container => {{
+                    container.classList.toggle('active', container.id === targetId);
                 }});
                 
-                // Show selected chart
-                document.getElementById('weekly-chart-' + weeks).style.display = 'block';
-                
                 // Update button states
                 document.querySelectorAll('.week-toggle-btn').forEach(btn => {{
                     btn.classList.remove('active');
@@ -1620,15 +1890,13 @@ class TicketDataProcessor:
                     const barType = checkbox.dataset.barType;
                     const isVisible = checkbox.checked;
                     
-                    // Apply to all visible charts
-                    document.querySelectorAll('.weekly-chart-container').forEach(container => {{
-                        if (container.style.display !== 'none') {{
-                            // Find and toggle bars/lines based on type
-                            const chartElements = container.querySelectorAll(`[data-bar-type="${{barType}}"]`);
-                            chartElements.forEach(element => {{
-                                element.style.display = isVisible ? 'block' : 'none';
-                            }});
-                        }}
+                    // Apply to the visible range variant
+                    document.querySelectorAll('.weekly-variant.active').forEach(container => {{
+                        // Find and toggle bars/lines based on type
+                        const chartElements = container.querySelectorAll(`[data-bar-type="${{barType}}"]`);
+                        chartElements.forEach(element => {{
+                            element.style.display = isVisible ? 'block' : 'none';
+                        }});
                     }});
                 }});
             }}
@@ -1663,14 +1931,14 @@ class TicketDataProcessor:
             print(f"🔄 Creating weekend response time chart...")
 
             # Use the full dataset to show all weekend data
-            df_all = self.df.copy()
+            df_all = self.df
 
             if df_all is None or len(df_all) == 0:
                 print("⚠️  No full dataset available for weekend chart")
                 return ""
 
             # Filter to weekend tickets only
-            weekend_df = df_all[df_all["Weekend_Ticket"] == True].copy()
+            weekend_df = df_all[df_all["Weekend_Ticket"].to_numpy() == True]
 
             if len(weekend_df) == 0:
                 print("⚠️  No weekend tickets found")
@@ -1683,16 +1951,11 @@ class TicketDataProcessor:
                 print("⚠️  'First Response Time (Hours)' column missing")
                 return ""
 
-            import plotly.graph_objects as go
-            from datetime import timedelta
-
-            # Calculate Monday dates for grouping
-            weekend_df['Monday'] = weekend_df["Create date"].dt.normalize().apply(
-                lambda x: x - timedelta(days=x.weekday())
-            )
+            if not PLOTLY_AVAILABLE:
+                raise ImportError("Plotly not available")
 
-            # Calculate weekly weekend stats
-            weekend_stats = weekend_df.groupby('Monday').agg({
+            # Calculate weekly weekend stats (Monday keys align to weekend_df by index)
+            weekend_stats = weekend_df.groupby(self._week_starts().rename('Monday')).agg({
                 'First Response Time (Hours)': ['median', 'mean', 'count']
             }).reset_index()
 
@@ -1720,7 +1983,6 @@ class TicketDataProcessor:
             ))
 
             # Add trend line
-            import numpy as np
             if len(weekend_stats) > 1:
                 x_values = np.arange(len(weekend_stats))
                 y_values = weekend_stats['Weekend_Median'].values
@@ -1755,7 +2017,7 @@ class TicketDataProcessor:
                 yaxis=dict(gridcolor='rgba(102, 126, 234, 0.2)', showgrid=True)
             )
 
-            chart_html = fig.to_html(include_plotlyjs="cdn", div_id="weekend-response-chart")
+            chart_html = self._emit_plotly(fig, "weekend-response-chart")
 
             return f"""
             <div class="section">
@@ -1789,11 +2051,11 @@ class TicketDataProcessor:
         """
         try:
             print(f"🔍 Creating interactive {stat_type} weekly chart...")
-            import plotly.graph_objects as go
-            from datetime import datetime, timedelta
+            if not PLOTLY_AVAILABLE:
+                raise ImportError("Plotly not available")
             
             # Use the full dataset to show all weeks of 2025, regardless of analysis period
-            df_all = self.df.copy()
+            df_all = self.df
             
             if df_all is None or len(df_all) == 0:
                 print("⚠️  No full dataset available")
@@ -1807,20 +2069,19 @@ class TicketDataProcessor:
                 print("⚠️  Invalid date range in dataset")
                 return ""
             
-            print(f"   Date range: {min_date} to {max_date}")
+            logger.debug(f"   Date range: {min_date} to {max_date}")
             
             # Get Monday of each week - use naive datetime for consistency
             try:
-                df_all['Monday'] = df_all["Create date"].dt.normalize().apply(
-                    lambda x: x - timedelta(days=x.weekday())
-                )
+                monday = self._week_starts().rename('Monday')
             except Exception as e:
                 print(f"⚠️  Error calculating Monday dates: {e}")
                 return ""
             
-            # Debug: Check for data issues
-            print(f"   Total tickets: {len(df_all)}")
-            print(f"   Unique Mondays: {df_all['Monday'].nunique()}")
+            # Debug: Check for data issues (nunique is a full hash pass, so only when debugging)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"   Total tickets: {len(df_all)}")
+                logger.debug(f"   Unique Mondays: {monday.nunique()}")
             
             # Check required columns
             required_cols = ['Weekend_Ticket', 'First Response Time (Hours)']
@@ -1831,80 +2092,44 @@ class TicketDataProcessor:
             
             # Determine chart title and y-axis label based on stat_type
             stat_label = stat_type.title()
-            print(f"   Calculating {stat_label} statistics...")
+            logger.debug(f"   Calculating {stat_label} statistics...")
             
             # Check if we have valid response time data
             valid_response_data = df_all['First Response Time (Hours)'].notna()
-            print(f"   Valid response times: {valid_response_data.sum()} of {len(df_all)}")
+            valid_response_count = int(valid_response_data.sum())
+            logger.debug(f"   Valid response times: {valid_response_count} of {len(df_all)}")
             
-            if valid_response_data.sum() == 0:
+            if valid_response_count == 0:
                 print("⚠️  No valid response time data available")
                 return ""
             
-            try:
-                # Calculate comprehensive weekly stats for ALL ticket types (using specified stat_type)
-                print(f"   Calculating all tickets {stat_type}...")
-                weekly_stats_all = df_all.groupby('Monday').agg({
-                    'First Response Time (Hours)': [stat_type, 'count']
-                }).reset_index()
-                weekly_stats_all.columns = ['Monday', 'All_Tickets', 'All_Count']
-                print(f"   All tickets weekly stats shape: {weekly_stats_all.shape}")
-            except Exception as e:
-                print(f"⚠️  Error calculating all tickets stats: {e}")
-                return ""
-            
-            try:
-                # Calculate weekly stats for WEEKDAY ONLY tickets (using specified stat_type)
-                df_weekday = df_all[df_all["Weekend_Ticket"] == False].copy()
-                print(f"   Weekday tickets: {len(df_weekday)}")
-                if len(df_weekday) > 0:
-                    weekly_stats_weekday = df_weekday.groupby('Monday').agg({
-                        'First Response Time (Hours)': [stat_type, 'count']
-                    }).reset_index()
-                    weekly_stats_weekday.columns = ['Monday', 'Weekday_Only', 'Weekday_Count']
-                    print(f"   Weekday weekly stats shape: {weekly_stats_weekday.shape}")
-                else:
-                    weekly_stats_weekday = pd.DataFrame(columns=['Monday', 'Weekday_Only', 'Weekday_Count'])
-                    print(f"   No weekday tickets found")
-            except Exception as e:
-                print(f"⚠️  Error calculating weekday stats: {e}")
-                return ""
+            # Weekend flag as one boolean mask over the full dataset
+            weekend_mask = df_all["Weekend_Ticket"].to_numpy(dtype=bool)
+            weekend_available = bool(weekend_mask.any())
+            response_hours = df_all['First Response Time (Hours)']
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"   Weekday tickets: {int((~weekend_mask).sum())}")
+                logger.debug(f"   Weekend tickets: {int(weekend_mask.sum())}")
             
             try:
-                # Calculate weekly stats for WEEKEND ONLY tickets (using specified stat_type)
-                df_weekend = df_all[df_all["Weekend_Ticket"] == True].copy()
-                print(f"   Weekend tickets: {len(df_weekend)}")
-                if len(df_weekend) > 0:
-                    valid_weekend_response = df_weekend['First Response Time (Hours)'].notna()
-                    print(f"   Valid weekend response times: {valid_weekend_response.sum()}")
-                    weekly_stats_weekend = df_weekend.groupby('Monday').agg({
-                        'First Response Time (Hours)': [stat_type, 'count']
-                    }).reset_index()
-                    weekly_stats_weekend.columns = ['Monday', 'Weekend_Only', 'Weekend_Count']
-                    print(f"   Weekend weekly stats shape: {weekly_stats_weekend.shape}")
-                else:
-                    weekly_stats_weekend = pd.DataFrame(columns=['Monday', 'Weekend_Only', 'Weekend_Count'])
-                    print(f"   No weekend tickets found")
+                # Weekly stats for ALL, WEEKDAY ONLY and WEEKEND ONLY tickets (grouped once per dataset, shared by median and mean)
+                logger.debug(f"   Calculating weekly {stat_type} statistics...")
+                grouped = self._weekly_response_stats()
+                columns = {
+                    'All_Tickets': ('all', stat_type), 'All_Count': ('all', 'count'),
+                    'Weekday_Only': ('weekday', stat_type), 'Weekday_Count': ('weekday', 'count'),
+                }
+                if weekend_available:
+                    columns.update(Weekend_Only=('weekend', stat_type), Weekend_Count=('weekend', 'count'))
+                weekly_stats = pd.DataFrame({name: grouped[column] for name, column in columns.items()}).reset_index()
             except Exception as e:
-                print(f"⚠️  Error calculating weekend stats: {e}")
+                print(f"⚠️  Error calculating weekly stats: {e}")
                 return ""
             
-            # Merge all data
-            weekly_stats = weekly_stats_all.merge(weekly_stats_weekday, on='Monday', how='left')
-            if len(df_weekend) > 0:
-                weekly_stats = weekly_stats.merge(weekly_stats_weekend, on='Monday', how='left')
-            
-            # Convert all numeric columns to proper float types and handle NaN values
-            numeric_cols = ['All_Tickets', 'All_Count', 'Weekday_Only', 'Weekday_Count']
-            if 'Weekend_Only' in weekly_stats.columns:
-                numeric_cols.extend(['Weekend_Only', 'Weekend_Count'])
-            
-            for col in numeric_cols:
-                if col in weekly_stats.columns:
-                    weekly_stats[col] = pd.to_numeric(weekly_stats[col], errors='coerce')
-                    
-            print(f"   Weekly stats dtypes after conversion: {weekly_stats.dtypes.to_dict()}")
-            print(f"   Weekly stats shape: {weekly_stats.shape}")
+            # Columns come straight from one numeric groupby on the shared Monday index (no joins, no dtype repair)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"   Weekly stats dtypes: {weekly_stats.dtypes.to_dict()}")
+                logger.debug(f"   Weekly stats shape: {weekly_stats.shape}")
             
             # Check for empty data after conversion
             if len(weekly_stats) == 0:
@@ -1913,11 +2138,15 @@ class TicketDataProcessor:
             
             # Calculate overall statistics for trend lines (using specified stat_type)
             try:
-                stat_func = getattr(df_all['First Response Time (Hours)'], stat_type)
-                overall_stat_all = stat_func()
-                overall_stat_weekday = getattr(df_weekday['First Response Time (Hours)'], stat_type)()
-                overall_stat_weekend = getattr(df_weekend['First Response Time (Hours)'], stat_type)() if len(df_weekend) > 0 else None
-                print(f"   Overall stats - All: {overall_stat_all}, Weekday: {overall_stat_weekday}, Weekend: {overall_stat_weekend}")
+                stat_fn = {'median': np.nanmedian, 'mean': np.nanmean}[stat_type]
+                hours = response_hours.to_numpy(dtype=float)
+                with warnings.catch_warnings():
+                    # All-NaN partitions (e.g. no answered weekend tickets) give NaN, as the pandas methods did
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    overall_stat_all = stat_fn(hours)
+                    overall_stat_weekday = stat_fn(hours[~weekend_mask])
+                    overall_stat_weekend = stat_fn(hours[weekend_mask]) if weekend_available else None
+                logger.debug(f"   Overall stats - All: {overall_stat_all}, Weekday: {overall_stat_weekday}, Weekend: {overall_stat_weekend}")
             except Exception as e:
                 print(f"⚠️  Error calculating overall stats: {e}")
                 return ""
@@ -1927,10 +2156,12 @@ class TicketDataProcessor:
             
             # Format dates for display
             weekly_stats['Week_Label'] = weekly_stats['Monday'].dt.strftime('%b %d')
+            # One shared label list for every trace's x
+            week_labels = weekly_stats['Week_Label'].tolist()
             
             # Add bars with proper IDs for toggle functionality
             fig.add_trace(go.Bar(
-                x=weekly_stats['Week_Label'],
+                x=week_labels,
                 y=weekly_stats['All_Tickets'],
                 name=f'All Tickets {stat_label}',
                 marker_color='rgba(78, 205, 196, 0.8)',
@@ -1941,7 +2172,7 @@ class TicketDataProcessor:
             ))
             
             fig.add_trace(go.Bar(
-                x=weekly_stats['Week_Label'],
+                x=week_labels,
                 y=weekly_stats['Weekday_Only'],
                 name=f'Weekday {stat_label}',
                 marker_color='rgba(255, 107, 107, 0.8)',
@@ -1951,9 +2182,9 @@ class TicketDataProcessor:
                 uid='bar-weekday'
             ))
             
-            if 'Weekend_Only' in weekly_stats.columns:
+            if weekend_available:
                 fig.add_trace(go.Bar(
-                    x=weekly_stats['Week_Label'],
+                    x=week_labels,
                     y=weekly_stats['Weekend_Only'],
                     name=f'Weekend {stat_label}',
                     marker_color='rgba(255, 234, 167, 0.8)',
@@ -1965,26 +2196,25 @@ class TicketDataProcessor:
                 ))
             
             # Add trend lines using linear regression
-            import numpy as np
             x_values = np.arange(len(weekly_stats))
             
             try:
                 # Calculate trend for all tickets
                 if len(weekly_stats) > 1 and weekly_stats['All_Tickets'].notna().sum() > 1:
-                    # Remove NaN values for polyfit
+                    # Remove NaN values before fitting
                     valid_mask = weekly_stats['All_Tickets'].notna()
                     if valid_mask.sum() > 1:
                         x_valid = x_values[valid_mask]
                         y_valid = weekly_stats['All_Tickets'].values[valid_mask].astype(float)
-                        slope_all, intercept_all = np.polyfit(x_valid, y_valid, 1)
-                        trend_y_all = slope_all * x_values + intercept_all
+                        slope_all, intercept_all = self._linear_fit(x_valid, y_valid)
+                        trend_y_all = np.round(slope_all * x_values + intercept_all, 3)
                     else:
                         trend_y_all = [overall_stat_all] * len(weekly_stats)
                 else:
                     trend_y_all = [overall_stat_all] * len(weekly_stats)
                 
                 fig.add_trace(go.Scatter(
-                    x=weekly_stats['Week_Label'],
+                    x=week_labels,
                     y=trend_y_all,
                     mode='lines',
                     name='Trend Line (All)',
@@ -2001,20 +2231,20 @@ class TicketDataProcessor:
             try:
                 # Calculate trend for weekday tickets
                 if len(weekly_stats) > 1 and 'Weekday_Only' in weekly_stats.columns and weekly_stats['Weekday_Only'].notna().sum() > 1:
-                    # Remove NaN values for polyfit
+                    # Remove NaN values before fitting
                     valid_mask = weekly_stats['Weekday_Only'].notna()
                     if valid_mask.sum() > 1:
                         x_valid = x_values[valid_mask]
                         y_valid = weekly_stats['Weekday_Only'].values[valid_mask].astype(float)
-                        slope_weekday, intercept_weekday = np.polyfit(x_valid, y_valid, 1)
-                        trend_y_weekday = slope_weekday * x_values + intercept_weekday
+                        slope_weekday, intercept_weekday = self._linear_fit(x_valid, y_valid)
+                        trend_y_weekday = np.round(slope_weekday * x_values + intercept_weekday, 3)
                     else:
                         trend_y_weekday = [overall_stat_weekday] * len(weekly_stats)
                 else:
                     trend_y_weekday = [overall_stat_weekday] * len(weekly_stats)
                 
                 fig.add_trace(go.Scatter(
-                    x=weekly_stats['Week_Label'],
+                    x=week_labels,
                     y=trend_y_weekday,
                     mode='lines',
                     name='Trend Line (Weekday)',
@@ -2032,19 +2262,19 @@ class TicketDataProcessor:
                 # Calculate trend for weekend tickets
                 if (overall_stat_weekend is not None and
                     len(weekly_stats) > 1 and
-                    'Weekend_Only' in weekly_stats.columns and
+                    weekend_available and
                     weekly_stats['Weekend_Only'].notna().sum() > 1):
                     
-                    # Remove NaN values for polyfit
+                    # Remove NaN values before fitting
                     valid_mask = weekly_stats['Weekend_Only'].notna()
                     if valid_mask.sum() > 1:
                         x_valid = x_values[valid_mask]
                         y_valid = weekly_stats['Weekend_Only'].values[valid_mask].astype(float)
-                        slope_weekend, intercept_weekend = np.polyfit(x_valid, y_valid, 1)
-                        trend_y_weekend = slope_weekend * x_values + intercept_weekend
+                        slope_weekend, intercept_weekend = self._linear_fit(x_valid, y_valid)
+                        trend_y_weekend = np.round(slope_weekend * x_values + intercept_weekend, 3)
                         
                         fig.add_trace(go.Scatter(
-                            x=weekly_stats['Week_Label'],
+                            x=week_labels,
                             y=trend_y_weekend,
                             mode='lines',
                             name='Trend Line (Weekend)',
@@ -2069,10 +2299,7 @@ class TicketDataProcessor:
                 xaxis_title='Week Starting',
                 yaxis_title=y_axis_title,
                 barmode='group',
-                template='plotly_dark',
-                plot_bgcolor='rgba(30, 30, 46, 0.8)',  # Darker background with contrast
-                paper_bgcolor='rgba(23, 23, 35, 0.9)',  # Even darker paper background
-                font=dict(color='#e0e0e0'),
+                **_DARK_LAYOUT,
                 height=400,
                 margin=dict(l=50, r=50, t=50, b=50),
                 # Add grid lines for better readability
@@ -2086,155 +2313,28 @@ class TicketDataProcessor:
                 )
             )
             
-            # Generate different timespan variants
-            charts_html = []
-            
-            # All weeks chart
-            chart_all_html = fig.to_html(include_plotlyjs="cdn", div_id=f"plotly-div-{stat_type}-all")
-            charts_html.append(('all', chart_all_html))
-            
-            # 12 weeks chart
-            if len(weekly_stats) > 12:
-                fig_12 = go.Figure(fig)
-                # Slice x/y to last 12 points; preserve per-trace visibility
-                for tr in fig_12.data:
-                    try:
-                        if hasattr(tr, "x"):
-                            tr.x = list(weekly_stats['Week_Label'][-12:])
-                        if hasattr(tr, "y") and tr.y is not None and len(tr.y) == len(weekly_stats):
-                            tr.y = tr.y[-12:]
-                    except Exception:
-                        pass
-                chart_12_html = fig_12.to_html(include_plotlyjs="cdn", div_id=f"plotly-div-{stat_type}-12")
-                charts_html.append(('12', chart_12_html))
-            
-            # 8 weeks chart
-            if len(weekly_stats) > 8:
-                fig_8 = go.Figure(fig)
-                # Slice x/y to last 8 points; preserve per-trace visibility
-                for tr in fig_8.data:
-                    try:
-                        if hasattr(tr, "x"):
-                            tr.x = list(weekly_stats['Week_Label'][-8:])
-                        if hasattr(tr, "y") and tr.y is not None and len(tr.y) == len(weekly_stats):
-                            tr.y = tr.y[-8:]
-                    except Exception:
-                        pass
-                chart_8_html = fig_8.to_html(include_plotlyjs="cdn", div_id=f"plotly-div-{stat_type}-8")
-                charts_html.append(('8', chart_8_html))
+            # Serialize the full series once; the 12/8-week views are sliced client-side
+            default_weeks = '12' if len(weekly_stats) > 12 else 'all'
+            trace_types = json.dumps([trace.customdata[0] if trace.customdata else None for trace in fig.data])
+            chart_html = self._emit_plotly(fig, f"plotly-div-{stat_type}-all")
             
             # Create enhanced toggleable chart container with proper JavaScript
-            weekend_available = 'Weekend_Only' in weekly_stats.columns
             # WEEKEND CONTROLS DISABLED: Weekend staffing starts in 6 weeks
             weekend_controls = ''  # No weekend controls until staffing is in place
             
-            chart_containers = '\n'.join([
-                f'<div id="weekly-chart-{stat_type}-{variant}" class="weekly-chart-{stat_type}-container" style="display: {"block" if variant == "12" else "none"};">{html}</div>'
-                for variant, html in charts_html
-            ])
-            
-            # Enhanced JavaScript with proper Plotly integration
-            javascript = f"""
-            <script>
-            function showWeeklyChart_{stat_type}(weeks) {{
-                // Hide all charts for this stat type
-                document.querySelectorAll('.weekly-chart-{stat_type}-container').forEach(container => {{
-                    container.style.display = 'none';
-                }});
-                
-                // Show selected chart
-                const targetChart = document.getElementById('weekly-chart-{stat_type}-' + weeks);
-                if (targetChart) {{
-                    targetChart.style.display = 'block';
-                }}
-                
-                // Update button states
-                document.querySelectorAll('.week-toggle-btn-{stat_type}').forEach(btn => {{
-                    btn.classList.remove('active');
-                }});
-                const activeBtn = document.querySelector('.week-toggle-btn-{stat_type}[data-weeks="' + weeks + '"]');
-                if (activeBtn) {{
-                    activeBtn.classList.add('active');
-                }}
-                
-                // Weekend controls disabled - no bar visibility changes needed
-            }}
-
-            // Explicit defaults: weekend series off by default; others on
-            const WEEKLY_DEFAULTS_{stat_type} = {{ all: true, weekday: true, 'trend-all': true, 'trend-weekday': true, weekend: false, 'trend-weekend': false }};
-
-            function initControls_{stat_type}() {{
-                // Force initial checkbox states to defaults (prevents any accidental auto-checking)
-                const defaults = WEEKLY_DEFAULTS_{stat_type};
-                document.querySelectorAll('.bar-toggle-{stat_type}').forEach(cb => {{
-                    const t = cb.dataset.barType;
-                    if (Object.prototype.hasOwnProperty.call(defaults, t)) {{
-                        cb.checked = defaults[t];
-                    }}
-                }});
-            }}
-            
-            function applyBarVisibility_{stat_type}() {{
-                const defaults = WEEKLY_DEFAULTS_{stat_type};
-                // Start from defaults, then override with live checkbox states
-                const visibilityMap = Object.assign({{}}, defaults);
-
-                // Build visibility map from checkboxes
-                document.querySelectorAll('.bar-toggle-{stat_type}').forEach(checkbox => {{
-                    const barType = checkbox.dataset.barType;
-                    visibilityMap[barType] = checkbox.checked;
-                }});
-                
-                // Apply to all visible Plotly charts for this stat type
-                document.querySelectorAll('.weekly-chart-{stat_type}-container').forEach(container => {{
-                    if (container.style.display !== 'none') {{
-                        const plotlyDiv = container.querySelector('[id^="plotly-div-{stat_type}-"]');
-                        if (plotlyDiv && window.Plotly && plotlyDiv._fullData) {{
-                            const updates = {{ visible: [] }};
-                            
-                            // Get the current trace data from Plotly's internal data
-                            plotlyDiv._fullData.forEach((trace) => {{
-                                if (trace.customdata && trace.customdata.length > 0) {{
-                                    const traceType = trace.customdata[0];
-                                    const shouldBeVisible = Object.prototype.hasOwnProperty.call(visibilityMap, traceType) ? visibilityMap[traceType] : true;
-                                    updates.visible.push(shouldBeVisible);
-                                }} else {{
-                                    updates.visible.push(true); // Default to visible for traces without customdata
-                                }}
-                            }});
-                            
-                            // Apply the visibility updates
-                            window.Plotly.restyle(plotlyDiv, updates);
-                        }}
-                    }}
-                }});
-            }}
+            chart_containers = f'<div id="weekly-chart-{stat_type}-all" class="weekly-chart-{stat_type}-container" style="display: block;">{chart_html}</div>'
             
-            // Update chart immediately when toggles change for this stat type
-            function updateChartDisplay_{stat_type}() {{
-                applyBarVisibility_{stat_type}();
-            }}
+            # Outer section id for this chart instance (scopes the delegated toggle listener)
+            section_id = container_id or f"weekly-{stat_type}"
             
-            // Add event listeners for bar toggles for this stat type
-            document.addEventListener('DOMContentLoaded', function() {{
-                // Ensure default-off logic for weekend before first render pass
-                initControls_{stat_type}();
-
-                document.querySelectorAll('.bar-toggle-{stat_type}').forEach(checkbox => {{
-                    checkbox.addEventListener('change', updateChartDisplay_{stat_type});
-                }});
-                
-                // Apply once after initializing defaults
-                setTimeout(updateChartDisplay_{stat_type}, 300);
-            }});
-            </script>
-            """
+            # Enhanced JavaScript with proper Plotly integration
+            javascript = _WEEKLY_CHART_SCRIPT.substitute(
+                stat_type=stat_type, trace_types=trace_types,
+                default_weeks=default_weeks, section_id=section_id,
+            )
             
-            # Generate unique IDs for this chart instance
-            chart_id = f"weekly-{stat_type}"
-
             buttons = [
-                f"<button class=\"week-toggle-btn-{stat_type}\" data-weeks=\"all\" onclick=\"showWeeklyChart_{stat_type}('all')\">All Weeks</button>"
+                f"<button class=\"week-toggle-btn-{stat_type}{' active' if default_weeks == 'all' else ''}\" data-weeks=\"all\" onclick=\"showWeeklyChart_{stat_type}('all')\">All Weeks</button>"
             ]
             if len(weekly_stats) > 12:
                 buttons.append(
@@ -2248,7 +2348,7 @@ class TicketDataProcessor:
             buttons_html = ''.join(buttons)
 
             return f"""
-        <div class="subsection" id="{container_id or f'weekly-{stat_type}'}" style="margin-bottom: 30px; display: {'block' if visible else 'none'};">
+        <div class="subsection" id="{section_id}" style="margin-bottom: 30px; display: {'block' if visible else 'none'};">
             <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 15px; flex-wrap: wrap;">
                 <div>
                     <h4 style="color: #00d4aa; margin: 0;">{chart_title}</h4>
@@ -2280,6 +2380,7 @@ class TicketDataProcessor:
 
             {chart_containers}
 
+            {self._weekly_chart_css()}
             {javascript}
         </div>
         """
@@ -2291,9 +2392,8 @@ class TicketDataProcessor:
     def _create_interactive_agent_charts(self, weekday_df: pd.DataFrame) -> List[str]:
         """Create interactive Plotly agent performance charts"""
         try:
-            import plotly.graph_objects as go
-            from plotly.subplots import make_subplots
-            import numpy as np
+            if not PLOTLY_AVAILABLE:
+                raise ImportError("Plotly not available")
             
             # Find ticket ID column
             ticket_id_col = None
@@ -2315,35 +2415,17 @@ class TicketDataProcessor:
             if not owner_col:
                 return []
             
-            # Filter out LiveChat tickets for response time calculations
-            non_livechat_df = weekday_df[weekday_df["Pipeline"] != "Live Chat "].copy()
-            
             # Calculate agent statistics (volume from all tickets, response times excluding LiveChat)
-            agent_stats = weekday_df.groupby(owner_col).agg({
-                ticket_id_col: "count",
-                "Pipeline": lambda x: x.value_counts().to_dict()
-            })
-            
-            # Calculate response time stats excluding LiveChat tickets
-            if len(non_livechat_df) > 0:
-                # Convert pd.NA to np.nan for aggregation compatibility
-                non_livechat_df = non_livechat_df.copy()
-                non_livechat_df["First Response Time (Hours)"] = non_livechat_df["First Response Time (Hours)"].replace({pd.NA: np.nan})
-
-                response_stats = non_livechat_df.groupby(owner_col)["First Response Time (Hours)"].agg(["mean", "median"])
-                response_stats.columns = ["Avg_Response_Time", "Median_Response_Time"]
-                agent_stats = agent_stats.join(response_stats, how='left')
-            else:
-                agent_stats["Avg_Response_Time"] = float('nan')
-                agent_stats["Median_Response_Time"] = float('nan')
-            
-            # Flatten columns - now they should already be flat
-            if isinstance(agent_stats.columns, pd.MultiIndex):
-                agent_stats.columns = agent_stats.columns.droplevel(1)
-            agent_stats.columns = ["Tickets_Handled", "Pipeline_Breakdown", "Avg_Response_Time", "Median_Response_Time"]
+            agent_stats = self._agent_response_frame(weekday_df, ticket_id_col).groupby(
+                weekday_df[owner_col], sort=False, observed=True
+            ).agg(
+                Tickets_Handled=("Ticket_ID", "count"),
+                Avg_Response_Time=("Response_Hours", "mean"),
+                Median_Response_Time=("Response_Hours", "median"),
+            )
             agent_stats["Tickets_Handled"] = agent_stats["Tickets_Handled"].astype(int)
-            agent_stats["Avg_Response_Time"] = agent_stats["Avg_Response_Time"].round(2)
-            agent_stats["Median_Response_Time"] = agent_stats["Median_Response_Time"].round(2)
+            time_cols = ["Avg_Response_Time", "Median_Response_Time"]
+            agent_stats[time_cols] = np.round(agent_stats[time_cols].to_numpy(dtype=float), 2)
             
             # Add percentage calculation
             total_tickets = len(weekday_df)
@@ -2355,120 +2437,28 @@ class TicketDataProcessor:
             
             charts = []
             
-            # Chart 1: Volume Distribution Bar Chart & Pie Chart
-            fig1 = make_subplots(
-                rows=1, cols=2,
-                column_widths=[0.6, 0.4],
-                subplot_titles=('📊 Ticket Volume by Agent', '🍰 Volume Distribution'),
-                specs=[[{"type": "bar"}, {"type": "pie"}]]
-            )
-            
-            # Bar chart
-            fig1.add_trace(
-                go.Bar(
-                    x=agent_stats.index,
-                    y=agent_stats["Tickets_Handled"],
-                    name="Tickets Handled",
-                    marker_color=['rgba(78, 205, 196, 0.8)', 'rgba(255, 107, 107, 0.8)', 
-                                 'rgba(255, 234, 167, 0.8)', 'rgba(162, 155, 254, 0.8)'][:len(agent_stats)],
-                    text=[f"{row['Tickets_Handled']}<br>({row['Percentage']}%)" 
-                          for _, row in agent_stats.iterrows()],
-                    textposition='auto',
-                    hovertemplate='<b>%{x}</b><br>Tickets: %{y}<br>Percentage: %{customdata}%<extra></extra>',
-                    customdata=agent_stats["Percentage"]
-                ),
-                row=1, col=1
-            )
-            
-            # Pie chart
-            fig1.add_trace(
-                go.Pie(
-                    labels=agent_stats.index,
-                    values=agent_stats["Tickets_Handled"],
-                    name="Distribution",
-                    marker_colors=['rgba(78, 205, 196, 0.8)', 'rgba(255, 107, 107, 0.8)', 
-                                  'rgba(255, 234, 167, 0.8)', 'rgba(162, 155, 254, 0.8)'][:len(agent_stats)],
-                    textinfo='label+percent',
-                    textposition='auto'
-                ),
-                row=1, col=2
-            )
-            
-            fig1.update_layout(
-                title_text="📊 Agent Performance: Volume Analysis",
-                template='plotly_dark',
-                plot_bgcolor='rgba(30, 30, 46, 0.8)',
-                paper_bgcolor='rgba(23, 23, 35, 0.9)',
-                font=dict(color='#e0e0e0'),
-                height=400,
-                showlegend=False
+            # Figures depend only on these few per-agent values; identical stats (e.g. re-rendering the
+            # same range on a fresh processor) reuse the already serialised figure specs
+            spec1, spec2 = _agent_figure_specs(
+                tuple(agent_stats.index),
+                tuple(agent_stats["Tickets_Handled"].tolist()),
+                tuple(agent_stats["Percentage"].tolist()),
+                tuple((agent_stats['Tickets_Handled'].astype(str) + "<br>("
+                       + agent_stats['Percentage'].astype(str) + "%)").tolist()),
+                tuple(None if np.isnan(v) else v for v in agent_stats["Avg_Response_Time"].tolist()),
+                tuple(None if np.isnan(v) else v for v in agent_stats["Median_Response_Time"].tolist()),
             )
             
-            fig1.update_xaxes(title_text="Agent", row=1, col=1)
-            fig1.update_yaxes(title_text="Number of Tickets", row=1, col=1)
-            
             chart1_html = f'''
             <div class="weekly-chart-container">
-                {fig1.to_html(include_plotlyjs="cdn")}
+                {self._emit_plotly_spec(*spec1, "ticket-agent-volume-chart")}
             </div>
             '''
             charts.append(chart1_html)
             
-            # Chart 2: Response Time Comparison (Average vs Median)
-            fig2 = go.Figure()
-
-            x_agents = agent_stats.index
-            x_pos = np.arange(len(x_agents))
-
-            # Fill NA values with None for Plotly (will show gaps instead of 0)
-            avg_times = agent_stats["Avg_Response_Time"].replace({pd.NA: None})
-            median_times = agent_stats["Median_Response_Time"].replace({pd.NA: None})
-
-            fig2.add_trace(go.Bar(
-                x=x_agents,
-                y=avg_times,
-                name='Average Response Time',
-                marker_color='rgba(102, 126, 234, 0.8)',
-                offsetgroup=1
-            ))
-
-            fig2.add_trace(go.Bar(
-                x=x_agents,
-                y=median_times,
-                name='Median Response Time',
-                marker_color='rgba(255, 107, 107, 0.8)',
-                offsetgroup=2
-            ))
-            
-            fig2.update_layout(
-                title='⏱️ Response Time Comparison: Average vs Median',
-                xaxis_title='Agent',
-                yaxis_title='Response Time (Hours)',
-                template='plotly_dark',
-                plot_bgcolor='rgba(30, 30, 46, 0.8)',
-                paper_bgcolor='rgba(23, 23, 35, 0.9)',
-                font=dict(color='#e0e0e0'),
-                height=400,
-                barmode='group',
-                xaxis=dict(gridcolor='rgba(102, 126, 234, 0.2)', showgrid=True),
-                yaxis=dict(gridcolor='rgba(102, 126, 234, 0.2)', showgrid=True),
-                annotations=[
-                    dict(
-                        text="💡 <b>Average vs Median:</b> When median is much lower than average, the agent has consistent fast responses but occasional long delays",
-                        xref="paper", yref="paper",
-                        x=0.5, y=1.15, xanchor='center', yanchor='bottom',
-                        showarrow=False,
-                        font=dict(size=11, color='#00d4aa'),
-                        bgcolor='rgba(0, 212, 170, 0.1)',
-                        bordercolor='rgba(0, 212, 170, 0.3)',
-                        borderwidth=1
-                    )
-                ]
-            )
-            
             chart2_html = f'''
             <div class="weekly-chart-container">
-                {fig2.to_html(include_plotlyjs="cdn")}
+                {self._emit_plotly_spec(*spec2, "ticket-agent-response-chart")}
                 <div style="margin-top: 10px; padding: 10px; background: rgba(0, 212, 170, 0.05); border-radius: 6px; border-left: 4px solid #00d4aa;">
                     <div style="color: #00d4aa; font-weight: bold; font-size: 0.9em; margin-bottom: 5px;">📖 Understanding Average vs Median:</div>
                     <div style="color: #e0e0e0; font-size: 0.85em; line-height: 1.4;">
@@ -2489,11 +2479,8 @@ class TicketDataProcessor:
     
     def _generate_weekly_chart_variant(self, weekly_stats, variant_type, min_date, max_date):
         """Generate a specific variant of the weekly chart (all, 8 weeks, 12 weeks)"""
+        fig = None
         try:
-            from datetime import datetime, timedelta
-            import numpy as np
-            from scipy import stats
-            
             if len(weekly_stats) == 0:
                 return "<p>No data available for this time range.</p>"
             
@@ -2517,7 +2504,8 @@ class TicketDataProcessor:
             # Calculate bar positioning
             num_bar_types = len(bar_types)
             bar_width = 0.7 / num_bar_types  # Adjust width based on number of bar types
-            bar_positions = [x_pos + (i - (num_bar_types-1)/2) * bar_width for i in range(num_bar_types)]
+            offsets = (np.arange(num_bar_types) - (num_bar_types - 1) / 2) * bar_width
+            bar_positions = x_pos + offsets[:, None]  # one row of x positions per bar type
             
             # Create bars for each type
             bar_objects = []
@@ -2568,21 +2556,21 @@ class TicketDataProcessor:
             ax.grid(axis='y', alpha=0.3, linestyle='-', linewidth=0.5)
             
             # Format x-axis labels
-            week_labels = [w.strftime('%m/%d') for w in weeks]
+            week_labels = weekly_stats['Week_Label'].tolist()
             ax.set_xticks(x_pos)
             ax.set_xticklabels(week_labels, rotation=45, ha='right')
             
-            # Add value labels on bars
+            # Add value labels on bars (long histories label only the highlighted most recent week;
+            # hundreds of per-bar text artists dominate render time and overlap anyway)
+            label_from = 0 if len(weeks) <= _WEEKLY_BAR_LABEL_LIMIT else len(weeks) - 1
             for bar_type, bars, data in bar_objects:
-                for i, (bar, value) in enumerate(zip(bars, data)):
-                    if pd.notna(value):
-                        height = bar.get_height()
-                        weight = 'bold' if i == len(bars) - 1 else 'normal'
-                        # Use dark color for better visibility - avoid white text
-                        color = '#000' if i == len(bars) - 1 else '#333'
-                        ax.text(bar.get_x() + bar.get_width()/2., height + 0.05,
-                                f'{height:.2f}h', ha='center', va='bottom',
-                                fontweight=weight, color=color, fontsize=8)
+                # bar_label blanks NaN bars itself; dark text for visibility, most recent week in bold
+                labels = np.char.mod('%.2fh', data.to_numpy(dtype=float))
+                labels[:label_from] = ''
+                texts = ax.bar_label(bars, labels=labels, padding=2, color='#333', fontsize=8)
+                if texts:
+                    texts[-1].set_fontweight('bold')
+                    texts[-1].set_color('#000')
             
             # Add legend
             ax.legend(loc='upper right', fontsize=11)
@@ -2600,6 +2588,8 @@ class TicketDataProcessor:
             return fig_to_html(fig)
             
         except Exception as e:
+            if fig is not None:
+                plt.close(fig)
             print(f"Error creating weekly chart variant {variant_type}: {e}")
             return f"<p>Error generating {variant_type} weeks chart.</p>"
     
@@ -2614,28 +2604,40 @@ class TicketDataProcessor:
         if not ticket_id_col:
             return ""
         
-        valid_response_df = df[df["First Response Time (Hours)"].notna() & 
-                              (df["First Response Time (Hours)"] > 0)].copy()
-        top_delayed = valid_response_df.nlargest(5, "First Response Time (Hours)")
+        # Top 5 positive response times by partition (O(n)) rather than filtering a copy and running
+        # nlargest; ties keep the earliest rows (as nlargest(keep="first")) and are listed in row order
+        hours = df["First Response Time (Hours)"].to_numpy(dtype=float)
+        valid = np.flatnonzero(hours > 0)
+        k = min(5, len(valid))
+        top_idx = valid[:0]
+        if k:
+            valid_hours = hours[valid]
+            threshold = np.partition(valid_hours, -k)[-k]
+            above = valid[valid_hours > threshold]
+            top_idx = np.concatenate([above, valid[valid_hours == threshold][:k - len(above)]])
+            top_idx = top_idx[np.lexsort((top_idx, -hours[top_idx]))]
+        top_delayed = df.iloc[top_idx]
         
-        rows = []
-        for _, row in top_delayed.iterrows():
-            ticket_id = row.get(ticket_id_col, "N/A")
-            response_hours = row["First Response Time (Hours)"]
-            response_time_display = f"{response_hours:.2f}h"
-            agent = row.get("Ticket owner", row.get("Case Owner", "Unknown"))
-            create_date = row["Create date"].strftime("%Y-%m-%d %H:%M") if pd.notna(row["Create date"]) else "N/A"
-            pipeline = row.get("Pipeline", "N/A")
-            
-            rows.append(f"""
-            <tr>
-                <td style="font-weight:bold">{ticket_id}</td>
-                <td style="text-align:center;color:#d9534f;font-weight:bold">{response_time_display}</td>
-                <td style="text-align:center">{agent}</td>
-                <td style="text-align:center">{create_date}</td>
-                <td style="text-align:center">{pipeline}</td>
-            </tr>
-            """)
+        # Pull each column once (dates formatted vectorised), then render every row from one template
+        def _column_or(name: str, default: str) -> pd.Series:
+            return top_delayed[name] if name in top_delayed.columns else pd.Series(default, index=top_delayed.index)
+
+        owner_col = "Ticket owner" if "Ticket owner" in top_delayed.columns else "Case Owner"
+        agents = _column_or(owner_col, "Unknown")
+        columns = zip(
+            top_delayed[ticket_id_col].to_numpy(),
+            top_delayed["First Response Time (Hours)"].to_numpy(dtype=float),
+            agents.to_numpy(),
+            top_delayed["Create date"].dt.strftime("%Y-%m-%d %H:%M").fillna("N/A").to_numpy(),
+            _column_or("Pipeline", "N/A").to_numpy(),
+        )
+        rows = "".join(
+            _DELAYED_ROW_TEMPLATE.format(
+                ticket_id=ticket_id, response_time=response_time, agent=agent,
+                create_date=create_date, pipeline=pipeline,
+            )
+            for ticket_id, response_time, agent, create_date, pipeline in columns
+        )
         
         return f"""
         <div class="section">
@@ -2651,7 +2653,7 @@ class TicketDataProcessor:
                     </tr>
                 </thead>
                 <tbody>
-                    {''.join(rows)}
+                    {rows}
                 </tbody>
             </table>
         </div>
@@ -2659,11 +2661,18 @@ class TicketDataProcessor:
     
     def create_summary_text(self, analysis_df: pd.DataFrame, label: str) -> str:
         """Create text summary"""
-        weekday_df = analysis_df[analysis_df["Weekend_Ticket"] == False]
         # Find owner column for summary
-        owner_col = "Ticket owner" if "Ticket owner" in weekday_df.columns else "Case Owner"
-        if owner_col in weekday_df.columns:
-            response_stats = weekday_df.groupby(owner_col)["First Response Time (Hours)"].mean().dropna().sort_values()
+        owner_col = "Ticket owner" if "Ticket owner" in analysis_df.columns else "Case Owner"
+        if owner_col in analysis_df.columns:
+            # Weekday mean per owner from bincount over factorized owners: no weekday copy of the
+            # frame and no groupby hash table for what is a handful of agents
+            codes, owners = pd.factorize(analysis_df[owner_col])
+            hours = analysis_df["First Response Time (Hours)"].to_numpy(dtype=float)
+            valid = ~analysis_df["Weekend_Ticket"].to_numpy(dtype=bool) & (codes >= 0) & ~np.isnan(hours)
+            counts = np.bincount(codes[valid], minlength=len(owners))
+            sums = np.bincount(codes[valid], weights=hours[valid], minlength=len(owners))
+            has_data = counts > 0
+            response_stats = pd.Series(sums[has_data] / counts[has_data], index=owners[has_data]).sort_values()
         else:
             response_stats = pd.Series(dtype=float)
         
@@ -2673,7 +2682,7 @@ TICKET ANALYTICS SUMMARY
 Period: {label}
 
 PROCESSING SUMMARY:
-- Original records: {len(self.original_df):,}
+- Original records: {self.original_row_count:,}
 - After SPAM removal: {len(self.df):,}
 - Support team only: Bhushan, Girly, Nova, Francis
 - Analyzed records: {len(analysis_df):,}
@@ -15,17 +15,31 @@ Phase 1: Real, data-driven widgets with parameter schema and reuse of existing p
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from functools import lru_cache
+from threading import Lock
 from typing import Callable, Dict, Tuple, Any, Optional, List
 from pathlib import Path
 
 import math
+import os
+import time
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import pytz
 
+# Parquet caching of processed results files needs pyarrow (optional)
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Data processors
 from ticket_processor import TicketDataProcessor
 from chat_processor import ChatDataProcessor
+from common_utils import PARQUET_DATE_COL
 
 # Central registry of widgets
 # Structure: { name: { "build": callable, "meta": { "title": str, "params": {...}, "examples": [...] } } }
@@ -77,18 +91,14 @@ def get_widget_and_meta(name: str) -> Tuple[Callable[[Dict[str, Any]], go.Figure
 # --------------------------------------------------------------------
 _BOOL_TRUE = {"true", "1", "yes", "y", "on"}
 _BOOL_FALSE = {"false", "0", "no", "n", "off"}
+_BOOL_MAP = {**{s: True for s in _BOOL_TRUE}, **{s: False for s in _BOOL_FALSE}}
 
 def coerce_bool(val: Any, default: bool = True) -> bool:
     if isinstance(val, bool):
         return val
     if val is None:
         return default
-    s = str(val).strip().lower()
-    if s in _BOOL_TRUE:
-        return True
-    if s in _BOOL_FALSE:
-        return False
-    return default
+    return _BOOL_MAP.get(str(val).strip().lower(), default)
 
 
 def normalize_params(raw: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
@@ -117,6 +127,10 @@ def normalize_params(raw: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, A
     return params
 
 
+_TZ_TICKETS = pytz.timezone("US/Eastern")
+_TZ_CHATS = pytz.timezone("Canada/Atlantic")
+
+
 def compute_range_bounds(range_value: str, source: str) -> Tuple[Optional[datetime], Optional[datetime]]:
     """
     Compute timezone-aware [start, end] datetimes from 'range' like '7d', '52w', '26w', '12w', '8w', '4w', 'ytd', or 'all'.
@@ -127,16 +141,26 @@ def compute_range_bounds(range_value: str, source: str) -> Tuple[Optional[dateti
     Note: 'd' suffix means BUSINESS DAYS (weekdays only), not calendar days
     Note: '13w' is special - mapped to quarterly view (4 quarters)
     """
-    tz = pytz.timezone("US/Eastern") if source == "tickets" else pytz.timezone("Canada/Atlantic")
+    tz = _TZ_TICKETS if source == "tickets" else _TZ_CHATS
     now = datetime.now(tz)
-    if not range_value or range_value == "all":
+    # Every start is a midnight that depends only on today's date, so it is cached per day;
+    # the end stays the exact current time
+    start = _range_start(range_value, tz, now.replace(hour=0, minute=0, second=0, microsecond=0))
+    if start is None:
         return None, None
+    return start, now
+
+
+@lru_cache(maxsize=64)
+def _range_start(range_value: str, tz: Any, now: datetime) -> Optional[datetime]:
+    """Start of the range as seen from midnight 'now' in 'tz'; None for 'all' and unknown ranges."""
+    if not range_value or range_value == "all":
+        return None
     try:
         if range_value == "ytd":
             # Year to date - from January 1st of current year
             start = tz.localize(datetime(now.year, 1, 1, 0, 0, 0))
-            end = now
-            return start, end
+            return start
         elif range_value == "13w":
             # Quarterly view - show 4 quarters (current + 3 previous)
             # Go back to start of quarter from 3 quarters ago
@@ -152,8 +176,7 @@ def compute_range_bounds(range_value: str, source: str) -> Tuple[Optional[dateti
             
             start_month = (start_quarter - 1) * 3 + 1  # Q1=1, Q2=4, Q3=7, Q4=10
             start = tz.localize(datetime(start_year, start_month, 1, 0, 0, 0))
-            end = now
-            return start, end
+            return start
         elif range_value.endswith("d"):
             # Business days (e.g., "7d" for last 7 business days)
             business_days = int(range_value[:-1])
@@ -170,19 +193,17 @@ def compute_range_bounds(range_value: str, source: str) -> Tuple[Optional[dateti
                 current = current - timedelta(days=1)
             # Normalize to start of day
             start = tz.localize(current.replace(hour=0, minute=0, second=0, microsecond=0).replace(tzinfo=None)) if current.tzinfo is None else current.replace(hour=0, minute=0, second=0, microsecond=0)
-            end = now
-            return start, end
+            return start
         elif range_value.endswith("w"):
             weeks = int(range_value[:-1])
             start = now - timedelta(weeks=weeks)
             # normalize to start of day
             start = tz.localize(start.replace(hour=0, minute=0, second=0, microsecond=0).replace(tzinfo=None)) if start.tzinfo is None else start.replace(hour=0, minute=0, second=0, microsecond=0)
-            end = now
-            return start, end
+            return start
         # fallback
-        return None, None
+        return None
     except Exception:
-        return None, None
+        return None
 
 
 def _no_data_figure(title: str, x_title: str, y_title: str) -> go.Figure:
@@ -245,6 +266,51 @@ def _find_latest_processed_data(source: str) -> Optional[Path]:
         return None
 
 
+def _utc_scalar(dt: datetime) -> "pa.Scalar":
+    """Arrow UTC timestamp scalar for a range bound (naive datetimes are taken as UTC)."""
+    ts = pd.Timestamp(dt)
+    ts = ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+    return pa.scalar(ts, type=pa.timestamp("ns", tz="UTC"))
+
+
+def _read_processed_file(csv_path: Path, start_dt: Optional[datetime] = None,
+                         end_dt: Optional[datetime] = None) -> Tuple[pd.DataFrame, int]:
+    """
+    Read a processed results CSV, through its Parquet sibling when one is current.
+
+    The sibling is written by the analytics run next to the CSV (common_utils.save_csv_file)
+    with the same columns and dtypes plus the date column parsed to UTC, so loads skip CSV
+    tokenizing and type inference and drop rows outside [start_dt, end_dt] in Arrow before
+    converting to pandas. The CSV path returns every row; callers still apply their own date
+    filter. The sibling is ignored once the CSV is newer, and any Parquet failure falls back
+    to the CSV. Widget loads never write to the results folder.
+
+    Returns:
+        (DataFrame, number of rows in the file)
+    """
+    parquet_path = csv_path.with_suffix(".parquet")
+    if PYARROW_AVAILABLE:
+        try:
+            if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+                dataset = ds.dataset(parquet_path, format="parquet")
+                names = dataset.schema.names
+                row_filter = None
+                if PARQUET_DATE_COL in names:
+                    date_field = ds.field(PARQUET_DATE_COL)
+                    if start_dt is not None:
+                        row_filter = date_field >= _utc_scalar(start_dt)
+                    if end_dt is not None:
+                        upper = date_field <= _utc_scalar(end_dt)
+                        row_filter = upper if row_filter is None else row_filter & upper
+                table = dataset.to_table(columns=[c for c in names if c != PARQUET_DATE_COL], filter=row_filter)
+                return table.to_pandas(), dataset.count_rows()
+        except Exception as e:
+            print(f"⚠️ Could not read {parquet_path.name}: {e}, reading CSV")
+
+    df = pd.read_csv(csv_path)
+    return df, len(df)
+
+
 def _load_processed_dataframe(source: str, start_dt: Optional[datetime], end_dt: Optional[datetime]) -> Optional[pd.DataFrame]:
     """
     Load processed data from the main app's results, with date filtering.
@@ -262,20 +328,22 @@ def _load_processed_dataframe(source: str, start_dt: Optional[datetime], end_dt:
         if processed_file is None:
             return None
         
-        # Load processed data
-        df = pd.read_csv(processed_file)
-        if len(df) == 0:
+        if source == "tickets":
+            date_col = "Create date"
+        else:  # chats
+            date_col = "chat_creation_date_adt"
+        
+        # Load processed data (Parquet reads arrive pre-filtered to the range)
+        df, total_rows = _read_processed_file(processed_file, start_dt, end_dt)
+        if total_rows == 0:
             return None
         
         # Apply date filtering if requested
         if start_dt is not None or end_dt is not None:
-            if source == "tickets":
-                date_col = "Create date"
-            else:  # chats
-                date_col = "chat_creation_date_adt"
-            
             if date_col not in df.columns:
                 return df  # Return unfiltered if date column missing
+            if len(df) == 0:
+                return df  # Parquet read already dropped every row outside the range
             
             # Convert date column to datetime
             df[date_col] = pd.to_datetime(df[date_col])
@@ -286,11 +354,28 @@ def _load_processed_dataframe(source: str, start_dt: Optional[datetime], end_dt:
             if end_dt is not None:
                 df = df[df[date_col] <= end_dt]
         
-        return df.copy()
+        return df
     except Exception:
         return None
 
 
+# In-process memo of loaded widget frames: {(source, range, start, end): (expires_at, df)}.
+# CacheManager keeps its memory tier on the instance, so the manager created per load never hits
+# without Redis; this lets the widgets of one dashboard (and repeat renders) share a single load.
+_DF_CACHE: Dict[Tuple[Any, ...], Tuple[float, pd.DataFrame]] = {}
+_DF_CACHE_LOCK = Lock()
+_DF_CACHE_TTL = 300  # seconds, same lifetime as the CacheManager entries
+
+
+def _remember_dataframe(key: Tuple[Any, ...], df: pd.DataFrame) -> None:
+    """Store a loaded frame in the in-process memo, dropping expired entries."""
+    now = time.monotonic()
+    with _DF_CACHE_LOCK:
+        for stale in [k for k, (expires, _) in _DF_CACHE.items() if expires <= now]:
+            del _DF_CACHE[stale]
+        _DF_CACHE[key] = (now + _DF_CACHE_TTL, df)
+
+
 def _load_source_dataframe(source: str, start_dt: Optional[datetime], end_dt: Optional[datetime], range_val: Optional[str] = None) -> Optional[pd.DataFrame]:
     """
     Load and process data for the given source with enhanced integration and caching.
@@ -302,18 +387,39 @@ def _load_source_dataframe(source: str, start_dt: Optional[datetime], end_dt: Op
     4. Processed data from main app results directory
     5. Fallback to processing raw CSV files
 
-    Returns the filtered DataFrame (copy) or None on failure.
+    Returns the filtered DataFrame or None on failure. The frame is shared with the cache,
+    so widgets must copy it before mutating it.
     """
-    # Generate cache key - include range_val to prevent different ranges from sharing cache
-    cache_key = f"data:{source}:{range_val}:{start_dt}:{end_dt}"
-    
-    # Priority 0: Check cache first
+    # Generate cache key - include range_val to prevent different ranges from sharing cache.
+    # Named ranges end at "now", which would make every key unique; the range already
+    # identifies them and the TTL bounds how stale their end can get.
+    key_end = end_dt if range_val is None else None
+    memo_key = (source, range_val, start_dt, key_end)
+    cache_key = f"data:{source}:{range_val}:{start_dt}:{key_end}"
+
+    def _cache_result(frame: pd.DataFrame) -> pd.DataFrame:
+        """Cache a freshly loaded frame (in process and in CacheManager) and return it."""
+        _remember_dataframe(memo_key, frame)
+        try:
+            cache.set(cache_key, frame, ttl=_DF_CACHE_TTL)
+        except Exception:
+            pass
+        return frame
+
+    # Priority 0: Check cache first (in-process memo, then CacheManager/Redis)
+    with _DF_CACHE_LOCK:
+        memo = _DF_CACHE.get(memo_key)
+    if memo is not None and memo[0] > time.monotonic():
+        print(f"✅ Using cached {source} data (in-process)")
+        return memo[1]
+
     try:
         from cache_manager import CacheManager
         cache = CacheManager()
         cached_data = cache.get(cache_key)
         if cached_data is not None:
             print(f"✅ Using cached {source} data (fastest)")
+            _remember_dataframe(memo_key, cached_data)
             return cached_data
     except Exception as e:
         print(f"⚠️ Cache check failed: {e}")
@@ -349,12 +455,7 @@ def _load_source_dataframe(source: str, start_dt: Optional[datetime], end_dt: Op
                 df = _ensure_ticket_columns(df)
                 
                 print(f"✅ Using Firestore {source} data (real-time primary source, response times recalculated)")
-                # Cache the result
-                try:
-                    cache.set(cache_key, df.copy(), ttl=300)
-                except:
-                    pass
-                return df.copy()
+                return _cache_result(df)
             else:
                 print(f"⚠️ Firestore returned empty DataFrame for tickets")
         elif source == "chats":
@@ -375,12 +476,7 @@ def _load_source_dataframe(source: str, start_dt: Optional[datetime], end_dt: Op
                 df = _ensure_chat_columns(df)
                 
                 print(f"✅ Using Firestore {source} data (real-time primary source, {len(df)} unique chats)")
-                # Cache the result
-                try:
-                    cache.set(cache_key, df.copy(), ttl=300)
-                except:
-                    pass
-                return df.copy()
+                return _cache_result(df)
             else:
                 print(f"⚠️ Firestore returned empty DataFrame for chats")
     except Exception as e:
@@ -398,22 +494,12 @@ def _load_source_dataframe(source: str, start_dt: Optional[datetime], end_dt: Op
                 df = sheets_ds.get_tickets_filtered(start_date=start_dt, end_date=end_dt)
                 if df is not None and not df.empty:
                     print(f"✅ Using Google Sheets {source} data (batch fallback)")
-                    # Cache the result
-                    try:
-                        cache.set(cache_key, df.copy(), ttl=300)
-                    except:
-                        pass
-                    return df.copy()
+                    return _cache_result(df)
             elif source == "chats":
                 df = sheets_ds.get_chats_filtered(start_date=start_dt, end_date=end_dt)
                 if df is not None and not df.empty:
                     print(f"✅ Using Google Sheets {source} data (batch fallback)")
-                    # Cache the result
-                    try:
-                        cache.set(cache_key, df.copy(), ttl=300)
-                    except:
-                        pass
-                    return df.copy()
+                    return _cache_result(df)
     except Exception as e:
         print(f"⚠️ Google Sheets unavailable: {e}, trying local data fallback")
 
@@ -421,12 +507,7 @@ def _load_source_dataframe(source: str, start_dt: Optional[datetime], end_dt: Op
     processed_df = _load_processed_dataframe(source, start_dt, end_dt)
     if processed_df is not None:
         print(f"✅ Using processed {source} data from results directory")
-        # Cache the result
-        try:
-            cache.set(cache_key, processed_df, ttl=300)
-        except:
-            pass
-        return processed_df
+        return _cache_result(processed_df)
 
     # Priority 4: Fallback to raw data processing
     try:
@@ -440,12 +521,7 @@ def _load_source_dataframe(source: str, start_dt: Optional[datetime], end_dt: Op
             proc.process_data()
             df_filtered, _, _ = proc.filter_date_range(start_dt, end_dt)
             print(f"⚙️ Processed raw {source} CSV data (final fallback)")
-            # Cache the result
-            try:
-                cache.set(cache_key, df_filtered.copy(), ttl=300)
-            except:
-                pass
-            return df_filtered.copy()
+            return _cache_result(df_filtered)
         elif source == "chats":
             data_dir = Path("chats")
             files = list(data_dir.glob("*.csv"))
@@ -456,12 +532,7 @@ def _load_source_dataframe(source: str, start_dt: Optional[datetime], end_dt: Op
             proc.process_data()
             df_filtered, _, _ = proc.filter_date_range(start_dt, end_dt)
             print(f"⚙️ Processed raw {source} CSV data (final fallback)")
-            # Cache the result
-            try:
-                cache.set(cache_key, df_filtered.copy(), ttl=300)
-            except:
-                pass
-            return df_filtered.copy()
+            return _cache_result(df_filtered)
         else:
             return None
     except Exception:
@@ -654,6 +725,26 @@ def _safe_hour_series(series: pd.Series) -> pd.Series:
     return pd.to_numeric(series, errors="coerce")
 
 
+_NS_PER_DAY = 86_400_000_000_000
+
+
+def _week_start(dates: pd.Series) -> pd.Series:
+    """
+    Start of each date's "W-MON" period (weeks ending Monday, so starting Tuesday).
+
+    Matches ``dates.dt.tz_localize(None).dt.to_period("W-MON").dt.start_time`` but
+    works on the int64 day numbers directly instead of boxing Period objects.
+    """
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    values = dates.to_numpy(dtype="datetime64[ns]")
+    days = values.view("i8") // _NS_PER_DAY
+    # Day 0 (1970-01-01) was a Thursday, so (days - 5) % 7 counts days since Tuesday
+    starts = ((days - (days - 5) % 7) * _NS_PER_DAY).view("datetime64[ns]")
+    starts[np.isnat(values)] = np.datetime64("NaT")
+    return pd.Series(starts, index=dates.index, name=dates.name)
+
+
 def _normalize_agent_name(name: str) -> Optional[str]:
     """
     Normalize agent names to canonical CS agent names.
@@ -961,7 +1052,7 @@ def tickets_by_pipeline(params: Dict[str, Any]) -> go.Figure:
         return _no_data_figure(meta.get("title"), "Pipeline", "Tickets")
 
     try:
-        data = df.copy()
+        data = df
         if pipelines:
             data = data[data["Pipeline"].isin(pipelines)]
         if len(data) == 0:
@@ -1129,12 +1220,12 @@ def weekly_response_breakdown(params: Dict[str, Any]) -> go.Figure:
 
         # Filter to selected view ONLY (weekday OR weekend, never both)
         if view == "weekend":
-            df = df[df["Weekend_Ticket"] == True].copy()
+            df = df[df["Weekend_Ticket"] == True]
             view_label = "Weekend"
             bar_color = "rgba(255, 234, 167, 0.85)"
             trend_color = "rgba(255, 193, 7, 0.9)"
         else:  # weekday (default)
-            df = df[df["Weekend_Ticket"] == False].copy()
+            df = df[df["Weekend_Ticket"] == False]
             view_label = "Weekday"
             bar_color = "rgba(78, 205, 196, 0.85)"
             trend_color = "rgba(0, 212, 170, 0.9)"
@@ -1203,11 +1294,11 @@ def weekly_response_breakdown(params: Dict[str, Any]) -> go.Figure:
             x_title = "Date"
         else:
             # Weekly aggregation for other ranges
-            week_start = df["Create date"].dt.tz_localize(None).dt.to_period("W-MON").dt.start_time
-            dfw = df.copy()
-            dfw["week_start"] = week_start
-            vals = _safe_hour_series(dfw["First Response Time (Hours)"])
-            dfw = dfw.assign(val=vals)
+            # Only the two columns the aggregation needs, not a copy of the whole frame
+            dfw = pd.DataFrame({
+                "week_start": _week_start(df["Create date"]),
+                "val": _safe_hour_series(df["First Response Time (Hours)"]),
+            })
             dfw = dfw[dfw["val"].notna() & (dfw["val"] > 0)]
 
             if len(dfw) == 0:
@@ -1612,11 +1703,12 @@ def chat_weekly_volume_breakdown(params: Dict[str, Any]) -> go.Figure:
             data["year"] = pd.to_datetime(data[date_col]).dt.year
             data["period_label"] = "Q" + data["quarter"].astype(str) + " " + data["year"].astype(str)
             
-            quarterly_total = data.groupby(["year", "quarter", "period_label"]).size().reset_index(name="Total")
-            quarterly_bot = data[data["_is_bot_only"]].groupby(["year", "quarter", "period_label"]).size().reset_index(name="Bot")
-            quarterly_human = data[data["_is_human_chat"]].groupby(["year", "quarter", "period_label"]).size().reset_index(name="Human")
-            
-            result = quarterly_total.merge(quarterly_bot, on=["year", "quarter", "period_label"], how="left").merge(quarterly_human, on=["year", "quarter", "period_label"], how="left").fillna(0)
+            # One pass: the flags are 0/1, so summing them counts bot and human chats per group
+            result = data.groupby(["year", "quarter", "period_label"]).agg(
+                Total=("_is_bot_only", "size"),
+                Bot=("_is_bot_only", "sum"),
+                Human=("_is_human_chat", "sum"),
+            ).reset_index()
             result = result.sort_values(["year", "quarter"])
             # Keep only last 4 quarters
             result = result.tail(4)
@@ -1624,14 +1716,14 @@ def chat_weekly_volume_breakdown(params: Dict[str, Any]) -> go.Figure:
             x_title = "Quarter"
         else:
             # Weekly grouping
-            week = pd.to_datetime(data[date_col]).dt.tz_localize(None).dt.to_period("W-MON").dt.start_time
+            week = _week_start(pd.to_datetime(data[date_col]))
             data["week_start"] = week
             
-            weekly_total = data.groupby("week_start").size().reset_index(name="Total")
-            weekly_bot = data[data["_is_bot_only"]].groupby("week_start").size().reset_index(name="Bot")
-            weekly_human = data[data["_is_human_chat"]].groupby("week_start").size().reset_index(name="Human")
-            
-            result = weekly_total.merge(weekly_bot, on="week_start", how="left").merge(weekly_human, on="week_start", how="left").fillna(0)
+            result = data.groupby("week_start").agg(
+                Total=("_is_bot_only", "size"),
+                Bot=("_is_bot_only", "sum"),
+                Human=("_is_human_chat", "sum"),
+            ).reset_index()
             result = result.sort_values("week_start")
             time_col = "week_start"
             x_title = "Week Starting"
@@ -1795,7 +1887,7 @@ def weekly_bot_satisfaction(params: Dict[str, Any]) -> go.Figure:
             title_suffix = '(Last 4 Quarters)'
         else:
             # Weekly view (default)
-            df['week_start'] = df['date'].dt.to_period('W-MON').dt.start_time
+            df['week_start'] = _week_start(df['date'])
             
             weekly = df.groupby('week_start').apply(
                 lambda x: pd.Series({
@@ -2271,7 +2363,7 @@ def agent_weekly_response_by_agent(params: Dict[str, Any]) -> go.Figure:
         if len(data) == 0:
             return _no_data_figure(meta.get("title"), "Week Starting", y_title)
 
-        data["week_start"] = data["Create date"].dt.tz_localize(None).dt.to_period("W-MON").dt.start_time
+        data["week_start"] = _week_start(data["Create date"])
         data["val"] = _safe_hour_series(data["First Response Time (Hours)"])
         data = data[data["val"].notna() & (data["val"] > 0)]
 
@@ -2364,7 +2456,7 @@ def agent_weekly_ticket_volume_by_agent(params: Dict[str, Any]) -> go.Figure:
             x_title = "Quarter"
         else:
             # Weekly grouping
-            data["week_start"] = data["Create date"].dt.tz_localize(None).dt.to_period("W-MON").dt.start_time
+            data["week_start"] = _week_start(data["Create date"])
             grouped = data.groupby(["week_start", owner_col]).size().reset_index(name="count")
             grouped = grouped.sort_values("week_start")
             time_col = "week_start"
@@ -3,7 +3,7 @@
 Widgets Blueprint Routes (Phase 0)
 - GET /widgets -> list all registered widgets
 - GET /widget/<name> -> HTML page suitable for iframe embedding
-- GET /widget/<name>.json -> JSON figure data (fig.to_dict())
+- GET /widget/<name>.json -> JSON figure data (fig.to_json())
 - GET /metrics -> HTML metric cards for embedding
 """
 
@@ -14,7 +14,7 @@ from typing import Any, Dict, List
 from datetime import datetime, timedelta
 import pytz
 
-from flask import Blueprint, render_template, request, abort, make_response, jsonify
+from flask import Blueprint, render_template, request, abort, make_response
 import pandas as pd
 
 from .registry import REGISTRY, get_widget_and_meta, normalize_params
@@ -248,7 +248,7 @@ def render_widget_html(name: str):
 @widgets_bp.route("/widget/<name>.json", methods=["GET"])
 def render_widget_json(name: str):
     """
-    Return the widget's Plotly figure data as JSON (fig.to_dict()).
+    Return the widget's Plotly figure data as JSON (fig.to_dict() shape).
     """
     try:
         builder, meta = get_widget_and_meta(name)
@@ -257,7 +257,9 @@ def render_widget_json(name: str):
 
     chart_params = _parse_widget_params(name, request.args)
     fig = builder(chart_params if chart_params is not None else {})
-    resp = jsonify(fig.to_dict())
+    # Plotly's serializer handles the numpy arrays in the figure and uses orjson when installed
+    resp = make_response(fig.to_json())
+    resp.mimetype = "application/json"
     return _apply_widget_headers(resp)
 
 